@@ -11,7 +11,6 @@ import random
 import uuid
 from datetime import datetime, timedelta
 from pathlib import Path
-from string import Template
 from typing import Dict, List
 
 # Libs
@@ -152,11 +151,11 @@ LINK_ID_MAPPINGS = {
     for r_type, links in LINK_MAPPINGS.items()  
 }
 
-COLLAB_PREFIX = Template("COLLAB_$collab_id")
-PROJECT_PREFIX = Template("PROJECT_$project_id")
-EXPT_PREFIX = Template("EXPT_$expt_id")
-RUN_PREFIX = Template("RUN_$run_id")
-PARTICIPANT_PREFIX = Template("PARTICIPANT_$participant_id")
+COLLAB_PREFIX = "COLLAB_{}".format
+PROJECT_PREFIX = "PROJECT_{}".format
+EXPT_PREFIX = "EXPT_{}".format
+RUN_PREFIX = "RUN_{}".format
+PARTICIPANT_PREFIX = "PARTICIPANT_{}".format
 PREFIXES = {
     'collaboration': COLLAB_PREFIX,
     'project': PROJECT_PREFIX,
@@ -225,7 +224,7 @@ def simulate_setup(
         All simulated keys (dict)
     """
     def construct_id(core_idx: int):
-        return "-".join([str(core_idx), str(uuid.uuid4())])
+        return f"{core_idx}-{uuid.uuid4()}"
 
     def update_topic_keys(key_dict, topic, new_key):
         topic_entries = key_dict.get(topic, [])
@@ -235,7 +234,7 @@ def simulate_setup(
     def create_key(key_dict, topic, idx, hierarchy):
         topic_prefix = PREFIXES.get(topic)
         topic_id_key = ID_KEYS.get(topic)
-        topic_id = topic_prefix.substitute({topic_id_key: construct_id(idx)})
+        topic_id = topic_prefix(construct_id(idx))
         topic_key = {**hierarchy, topic_id_key: topic_id}
         update_topic_keys(key_dict, topic, topic_key)
         return topic_key
@@ -341,10 +340,10 @@ def generate_project_info():
     return {
         "universe_alignment": [],
         "incentives": {},
-        "start_at": datetime.strptime(
-            datetime.utcnow().strftime('%Y-%m-%d %H:%M:%S'),
-            '%Y-%m-%d %H:%M:%S'
-        ) + timedelta(hours=random.randint(0, 1000))
+        "start_at": (
+            datetime.utcnow().replace(microsecond=0) + 
+            timedelta(hours=random.randint(0, 1000))
+        )
     }
 
 
@@ -38,11 +38,14 @@ class Records(AbstractRecords):
 
     Attributes:
         db_path (str): Path to json source
+        storage_class (type): Storage backing the database (default: JSON)
     
     Args:
         db_path (str): Path to json source
         *subjects: All subject types pertaining to records
     """
+    storage_class = JSONStorage
+
     def __init__(self, db_path: str):
         self.db_path = db_path
         
@@ -58,7 +61,7 @@ class Records(AbstractRecords):
         Returns:
             database (TinyDB)
         """
-        serialization = SerializationMiddleware(JSONStorage)
+        serialization = SerializationMiddleware(self.storage_class)
         serialization.register_serializer(DateTimeSerializer(), 'TinyDate')
         serialization.register_serializer(TimeDeltaSerializer(), 'TinyDelta')
 
@@ -102,10 +105,7 @@ class Records(AbstractRecords):
             with transaction(subject_table) as tr:
 
                 # Remove additional digits (eg. microseconds)
-                date_created = datetime.strptime(
-                    datetime.utcnow().strftime("%Y-%m-%d %H:%M:%S"),
-                    "%Y-%m-%d %H:%M:%S"
-                )
+                date_created = datetime.utcnow().replace(microsecond=0)
                 new_record['created_at'] = date_created
 
                 if subject_table.contains(where(key) == new_record[key]):
@@ -278,6 +278,43 @@ class TopicalRecords(Records):
         return all_related_records
 
 
+    def _index_related_metadata(
+        self, 
+        key: str
+    ) -> Dict[str, Dict[str, List[Document]]]:
+        """ Retrieves all records from all relations in a single pass, indexed
+            by the identifier they are related to (i.e. a bulk equivalent of
+            `_get_related_metadata`, for expanding many records at once)
+
+        Args:
+            key (str): Key to be used as a unique composite identifier
+        Returns:
+            Related records by subject & identifier (dict(str,dict))
+        """
+        database = self.load_database()
+
+        with database as db:
+
+            related_index = {}
+            for subject in self.relations:
+                related_table = db.table(subject)
+                subject_index = {}
+                for related_record in related_table.all():
+                    # Skip records without a valid composite key, as a
+                    # `where(key)[identifier]` query would have
+                    related_key = related_record.get(key)
+                    if not isinstance(related_key, dict):
+                        continue
+                    related_id = related_key.get(self.identifier)
+                    if related_id is not None:
+                        subject_index.setdefault(related_id, []).append(
+                            related_record
+                        )
+                related_index[subject] = subject_index
+
+        return related_index
+
+
     def _expand_record(self, record: Document, key: str) -> Document:
         """ Adds additional metadata from related subjects to specified record
 
@@ -318,6 +355,10 @@ class TopicalRecords(Records):
             Filtered records (list(tinydb.database.Document))
         """
         all_records = super().read_all(self.subject)
+
+        # Fetch all relations once, instead of once per record retrieved
+        related_index = self._index_related_metadata(f_key)
+
         expanded_records = []
         for record in all_records:
             if (
@@ -326,8 +367,15 @@ class TopicalRecords(Records):
                 (not filter.items() <= record.items())
             ):
                 continue
-            exp_record = self._expand_record(record, f_key)
-            expanded_records.append(exp_record)
+            r_id = record[f_key]
+            # Each record gets its own lists, as records may share identifiers
+            record['relations'] = {
+                subject: list(
+                    related_index[subject].get(r_id[self.identifier], ())
+                )
+                for subject in self.relations
+            }
+            expanded_records.append(record)
         return expanded_records
 
 
@@ -343,7 +391,12 @@ class TopicalRecords(Records):
         r_id: Dict[str, str], 
         updates: Dict[str, Union[int, float, str, list, dict]]
     ) -> Document:
-        updates.pop('key', None)
+        # Composite keys cannot be updated, but leave the caller's copy intact
+        updates = {
+            field: value
+            for field, value in updates.items()
+            if field != 'key'
+        }
         return super().update(self.subject, "key", r_id, updates)
 
 
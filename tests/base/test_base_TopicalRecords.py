@@ -165,12 +165,55 @@ def test_records_read(topicalRecord_env):
     check_field_equivalence(records, test_subject, test_key, retrieved_record)
 
 
+def test_records_read_all_relations(topicalRecord_env):
+    """ Tests if relations expanded in bulk are the same as those expanded for
+        each record singly, even when records share the same identifier
+
+    # C1: Check that each bulk-read record has the same relations as the one
+        read singly
+    # C2: Check that records sharing an identifier are given separate lists
+        of related records (i.e. mutating one does not affect the other)
+    """
+    (
+        topical_records, 
+        test_subject, test_key, test_ids, 
+        test_details, _,
+        records, _
+    ) = topicalRecord_env
+    # Simulate a sibling record that shares the same identifier
+    sibling_ids = {**test_ids, 'SIBLING_ID': "sibling"}
+    topical_records.create(new_record={test_key: sibling_ids, **test_details})
+
+    all_records = topical_records.read_all(f_key=test_key)
+    assert len(all_records) == 2
+    for retrieved_record in all_records:
+        # C1
+        singly_read_record = topical_records.read(
+            r_id=retrieved_record[test_key],
+            f_key=test_key
+        )
+        assert retrieved_record['relations'] == singly_read_record['relations']
+
+    # C2
+    record, sibling_record = all_records
+    for related_subject, related_records in record['relations'].items():
+        sibling_related_records = sibling_record['relations'][related_subject]
+        expected_count = len(sibling_related_records)
+        related_records.clear()
+        assert len(sibling_related_records) == expected_count > 0
+
+    # Remove sibling without cascading into the shared relations
+    records.delete(subject=test_subject, key=test_key, r_id=sibling_ids)
+
+
 def test_records_update(topicalRecord_env):
     """ Tests if a topical record can be updated correctly.
 
     # C1: Check that the original record was updated (not a copy)
     # C2: Check that the updated record is the same as the one that exists
         in the database
+    # C3: Check that the specified updates were left intact (i.e. the 
+        composite key was not popped from them)
     """
     (
         topical_records, 
@@ -182,14 +225,17 @@ def test_records_update(topicalRecord_env):
         r_id=test_ids,
         f_key=test_key
     )
+    keyed_updates = {**test_updates, 'key': test_ids}
     updated_record = topical_records.update(
         r_id=test_ids,
-        updates=test_updates
+        updates=keyed_updates
     )
     # C1
     assert updated_record.doc_id == retrieved_record.doc_id
     # C2
     check_field_equivalence(records, test_subject, test_key, updated_record)
+    # C3
+    assert keyed_updates == {**test_updates, 'key': test_ids}
 
 
 def test_records_delete(topicalRecord_env):
@@ -5,17 +5,23 @@
 ####################
 
 # Generic/Built-in
-import copy
+import functools
+import json
+import operator
 import os
 import random
 import uuid
 from datetime import datetime, timedelta
-from string import Template
-from typing import Dict, List, Tuple, Union
+from types import MappingProxyType
+from typing import (
+    Callable, Dict, FrozenSet, Iterator, List, NamedTuple, Tuple, 
+    Type, Union
+)
 
 # Libs
 import pytest
 import tinydb
+from tinydb.storages import Storage
 
 # Custom
 from synarchive.base import Records, TopicalRecords, AssociationRecords
@@ -30,9 +36,13 @@ from synarchive.evaluation import MLFRecords, ValidationRecords, PredictionRecor
 # Configurations #
 ##################
 
+# Each pytest-xdist worker (if any) archives into its own test database. As 
+# tests within a module build on one another, modules are to be distributed
+# whole (i.e. `pytest -n auto --dist loadfile`)
+TEST_WORKER = os.getenv("PYTEST_XDIST_WORKER")
 TEST_PATH = os.path.join(
     os.path.dirname(os.path.abspath(__file__)), 
-    "test_database.json"
+    f"test_database_{TEST_WORKER}.json" if TEST_WORKER else "test_database.json"
 )
 
 TTP_SUBJECTS = [
@@ -47,7 +57,7 @@ WORKER_SUBJECTS = [
     "Registration", "Tag", "Alignment"
 ]
 
-ID_KEYS = {
+ID_KEYS = MappingProxyType({
     'collaboration': 'collab_id',
     'project': 'project_id',
     'experiment': 'expt_id',
@@ -60,122 +70,287 @@ ID_KEYS = {
     'validation': 'val_id',
     'prediction': 'pred_id',
     'mlflow': 'name'
-}
+})
 
-RELATIONS_MAPPINGS = {
+# ID keys read off every simulated federated combination
+COLLAB_ID, PROJECT_ID, EXPT_ID, RUN_ID, PARTICIPANT_ID = (
+    ID_KEYS[topic] 
+    for topic in (
+        'collaboration', 'project', 'experiment', 'run', 'participant'
+    )
+)
+
+# Table names of downstream relations, as captured under a record's "relations"
+RELATIONS_MAPPINGS = MappingProxyType({
     # TTP-orchestrated mappings
-    'collaboration': [
+    'collaboration': frozenset([
         "Project", "Experiment", "Run", "Model", "Validation", "Prediction",
         "Registration", "Tag", "Alignment" 
-    ],
-    'project': [
+    ]),
+    'project': frozenset([
         "Experiment", "Run", "Model", "Validation", "Prediction",
         "Registration", "Tag", "Alignment" 
-    ],
-    'experiment': ["Run", "Model", "Validation", "Prediction"],
-    'run': ["Model", "Validation", "Prediction"],
-    'model': ["Validation", "Prediction"],
-    'validation': [],
-    'prediction': [],
+    ]),
+    'experiment': frozenset(["Run", "Model", "Validation", "Prediction"]),
+    'run': frozenset(["Model", "Validation", "Prediction"]),
+    'model': frozenset(["Validation", "Prediction"]),
+    'validation': frozenset(),
+    'prediction': frozenset(),
     
     # Worker-orchestrated mappings
-    'participant': [
+    'participant': frozenset([
         "Registration", "Tag", "Alignment", 
         "Validation", "Prediction"
-    ],
-    'registration': ["Tag", "Alignment"],
-    'tag': ["Alignment"],
-    'alignment': [],
+    ]),
+    'registration': frozenset(["Tag", "Alignment"]),
+    'tag': frozenset(["Alignment"]),
+    'alignment': frozenset(),
 
     # Misc mappings
-    'mlflow': []
-}
+    'mlflow': frozenset()
+})
 
-KEY_ID_MAPPINGS = {
+# Topics whose IDs make up the composite key of each record type
+KEY_CHAINS = MappingProxyType({
     # TTP-orchestrated mappings
-    'collaboration': [
-        ID_KEYS[r_type] 
-        for r_type in ["collaboration"]
-    ],
-    'project': [
-        ID_KEYS[r_type] 
-        for r_type in ["collaboration", "project"]
-    ],
-    'experiment': [
-        ID_KEYS[r_type] 
-        for r_type in ["collaboration", "project", "experiment"]
-    ],
-    'run': [
-        ID_KEYS[r_type] 
-        for r_type in ["collaboration", "project", "experiment", "run"]
-    ],
-    'model': [
-        ID_KEYS[r_type] 
-        for r_type in ["collaboration", "project", "experiment", "run"]
-    ],
-    'validation': [
-        ID_KEYS[r_type] 
-        for r_type in ["participant", "collaboration", "project", "experiment", "run"]
-    ],
-    'prediction': [
-        ID_KEYS[r_type] 
-        for r_type in ["participant", "collaboration", "project", "experiment", "run"]
-    ],
-    
-    # Worker-orchestrated mappings
-    'participant': [
-        ID_KEYS[r_type] 
-        for r_type in ["participant"]
-    ],
-    'registration': [
-        ID_KEYS[r_type] 
-        for r_type in ["participant", "collaboration", "project"]
-    ],
-    'tag': [
-        ID_KEYS[r_type] 
-        for r_type in ["participant", "collaboration", "project"]
-    ],
-    'alignment':[
-        ID_KEYS[r_type] 
-        for r_type in ["participant", "collaboration", "project"]
-    ],
-
-    # Misc mappings
-    'mlflow':["collaboration", "project", "name"],
-}
+    'collaboration': ("collaboration",),
+    'project': ("collaboration", "project"),
+    'experiment': ("collaboration", "project", "experiment"),
+    'run': ("collaboration", "project", "experiment", "run"),
+    'model': ("collaboration", "project", "experiment", "run"),
+    'validation': (
+        "participant", "collaboration", "project", "experiment", "run"
+    ),
+    'prediction': (
+        "participant", "collaboration", "project", "experiment", "run"
+    ),
 
-LINK_MAPPINGS = {
+    # Worker-orchestrated mappings
+    'participant': ("participant",),
+    'registration': ("participant", "collaboration", "project"),
+    'tag': ("participant", "collaboration", "project"),
+    'alignment': ("participant", "collaboration", "project")
+})
+
+KEY_ID_MAPPINGS = MappingProxyType({
+    **{
+        r_type: frozenset(ID_KEYS[topic] for topic in chain)
+        for r_type, chain in KEY_CHAINS.items()
+    },
+
+    # Misc mappings (MLFlow keys are named after their topics, not their IDs)
+    'mlflow': frozenset(["collaboration", "project", "name"])
+})
+
+LINK_MAPPINGS = MappingProxyType({
     # TTP-orchestrated mappings
-    'model': [],
-    'validation': [],   # no need to delete predictions if deleted
-    'prediction': [],   # no need to delete validations if deleted
+    'model': (),
+    'validation': (),   # no need to delete predictions if deleted
+    'prediction': (),   # no need to delete validations if deleted
     
     # Worker-orchestrated mappings
-    'registration': [],
-    'tag': ["Registration"],
-    'alignment': ["Registration", "Tag"]
-}
+    'registration': (),
+    'tag': ("Registration",),
+    'alignment': ("Registration", "Tag")
+})
 
-LINK_ID_MAPPINGS = {
-    r_type: (
+LINK_ID_MAPPINGS = MappingProxyType({
+    r_type: frozenset(
         [ID_KEYS[r_type]] +
         [ID_KEYS[subject.lower()] for subject in links]
     )
     for r_type, links in LINK_MAPPINGS.items()  
-}
-
-COLLAB_PREFIX = Template("COLLAB_$collab_id")
-PROJECT_PREFIX = Template("PROJECT_$project_id")
-EXPT_PREFIX = Template("EXPT_$expt_id")
-RUN_PREFIX = Template("RUN_$run_id")
-PARTICIPANT_PREFIX = Template("PARTICIPANT_$participant_id")
-PREFIXES = {
+})
+
+class RecordSpec(NamedTuple):
+    """ Expected structure of a record type, as asserted by its checks """
+    key: FrozenSet[str]
+    relations: FrozenSet[str]
+    link: FrozenSet[str]
+
+
+class FederatedIds(NamedTuple):
+    """ IDs that uniquely document the components of a federated cycle """
+    collab_id: str
+    project_id: str
+    expt_id: str
+    run_id: str
+    participant_id: str
+
+
+class EnvBundle(NamedTuple):
+    """ Archive under test in an env fixture, alongside its simulated data & 
+        the archives of its surrounding hierarchy (if any). The latter are not
+        just "downstream", as participation envs return the archives that are
+        upstream of them, and collab_env returns both.
+    """
+    records: Records
+    details: Union[dict, Tuple[dict, ...]]
+    updates: Union[dict, Tuple[dict, ...]]
+    ids: FederatedIds
+    hierarchy: Tuple[Records, ...]
+
+
+RECORD_SPECS = MappingProxyType({
+    r_type: RecordSpec(
+        key=KEY_ID_MAPPINGS[r_type],
+        relations=RELATIONS_MAPPINGS[r_type],
+        link=LINK_ID_MAPPINGS.get(r_type, frozenset())
+    )
+    for r_type in KEY_ID_MAPPINGS
+})
+
+# Fields carried by an association record obtained through a query. These are
+# generated by the archives themselves, rather than specified as details (i.e.
+# "link" is only in AssociationRecords, "relations" only in queries)
+QUERIED_FIELDS = frozenset(['created_at', 'key', 'relations', 'link'])
+get_queried_fields = operator.itemgetter('key', 'relations', 'link')
+
+COLLAB_PREFIX = "COLLAB_{}".format
+PROJECT_PREFIX = "PROJECT_{}".format
+EXPT_PREFIX = "EXPT_{}".format
+RUN_PREFIX = "RUN_{}".format
+PARTICIPANT_PREFIX = "PARTICIPANT_{}".format
+PREFIXES = MappingProxyType({
     'collaboration': COLLAB_PREFIX,
     'project': PROJECT_PREFIX,
     'experiment': EXPT_PREFIX,
     'run': RUN_PREFIX,
     'participant': PARTICIPANT_PREFIX
-}
+})
+
+REDUCTIONS = ("none", "mean", "sum")
+CLR_MODES = ("triangular", "triangular2", "exp_range")
+CLR_SCALE_MODES = ("cycle", "iterations")
+ACTIONS = ("classify", "regress")
+
+# Order in which surrounding hierarchies are populated by the env fixtures
+TRAINING_TOPICS = (
+    'project', 'experiment', 'run', 'model', 'validation', 'prediction'
+)
+PARTICIPATION_TOPICS = ('registration', 'tag', 'alignment')
+
+# Dedicated generator for simulated data, so that helpers need not contend
+# for (or perturb) the shared state of the global `random` module. It is 
+# seeded once per session (see `--seed`)
+RNG = random.Random()
+rand_int = RNG.randint
+rand_float = RNG.random
+rand_choice = RNG.choice
+rand_choices = RNG.choices
+
+# Populations for batched draws of simulated values (bounds are inclusive)
+X_ALIGNMENT_INDEXES = range(0, 1001)
+Y_ALIGNMENT_INDEXES = range(0, 11)
+INT_STAT_VALUES = range(0, 5001)
+PORTS = range(1001, 65536)
+
+MAX_GRID_COUNT = 10
+NODE_KEYS = tuple(f"node_{grid_idx}" for grid_idx in range(MAX_GRID_COUNT))
+
+# All possible simulated dataset tags, as there are only 11 sets x 11 versions
+TAG_POOL = tuple(
+    ("test_dataset", f"set_{set_idx}", f"version_{version_idx}")
+    for set_idx in range(0, 11)
+    for version_idx in range(0, 11)
+)
+
+# Pool of simulated IP addresses, drawn once instead of per simulated host. 
+# The pool is fixed, so that sessions remain reproducible from `--seed` alone
+IP_POOL_SIZE = 4096
+IP_OCTETS = range(1, 1001)
+IP_POOL_SEED = 0
+
+MLFLOW_EXPT_INFO = MappingProxyType({
+    "mlflow_id": "0",
+    "mlflow_type": "experiment",
+    "mlflow_uri": "/ttp/mlflow/test_collab/test_project_1",
+    "name": "test_experiment",
+    "project": "test_project_1",
+    "collaboration": "test_collab"
+})
+MLFLOW_RUN_INFO = MappingProxyType({
+    "mlflow_id": "f81c4ff2c4704a0da07da1d16b4dfe9e",
+    "mlflow_type": "run",
+    "mlflow_uri": "/ttp/mlflow/test_collab/test_project_1",
+    "name": "test_run",
+    "project": "test_project_1",
+    "collaboration": "test_collab"
+})
+
+# Archives bound to the test database, shared across fixtures
+RECORDS_REGISTRY = {}
+
+MODEL_OUTPUT_DIR = "/ttp/outputs/test_project_1/test_experiment/test_run"
+
+#######################################
+# Test Storage - SessionMemoryStorage #
+#######################################
+
+# Compact, reusable codecs for the in-memory copies of each test database
+encode_database = json.JSONEncoder(
+    check_circular=False, 
+    separators=(',', ':')
+).encode
+decode_database = json.JSONDecoder().decode
+
+
+class SessionMemoryStorage(Storage):
+    """ Keeps the JSON contents of each test database in memory for the rest
+        of the test session, keyed by path. Unlike TinyDB's `MemoryStorage`,
+        contents persist across the independent TinyDB instances that are 
+        created by every `Records.load_database()` call.
+
+    Args:
+        path (str): Path of the database being simulated
+        **kwargs: JSON formatting options, only applied when flushed to disk
+    """
+    DATABASES = {}
+    FORMATS = {}
+
+    def __init__(self, path: str, **kwargs):
+        super().__init__()
+        self.path = path
+        self.FORMATS[path] = kwargs
+
+    def read(self) -> Union[dict, None]:
+        serialized_data = self.DATABASES.get(self.path)
+        if serialized_data is None:
+            return None
+        return decode_database(serialized_data)
+
+    def write(self, data: dict) -> None:
+        self.DATABASES[self.path] = encode_database(data)
+
+    @classmethod
+    def discard(cls, path: str) -> None:
+        """ Erases the contents of a database outright (i.e. without opening
+            it & dropping its tables)
+
+        Args:
+            path (str): Path of the database being simulated
+        """
+        cls.DATABASES.pop(path, None)
+
+    @classmethod
+    def flush(cls) -> None:
+        """ Persists every database held in memory to its path on disk, in the
+            same format that the archives would have written it (e.g. sorted &
+            indented, as with `JSONStorage`)
+        """
+        for path, serialized_data in cls.DATABASES.items():
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            with open(path, 'w') as db_file:
+                json.dump(
+                    decode_database(serialized_data), 
+                    db_file, 
+                    **cls.FORMATS.get(path, {})
+                )
+
+
+# Storage backing all archives for the test session
+TEST_STORAGE = SessionMemoryStorage
+
 
 ###########
 # Helpers #
@@ -187,7 +362,22 @@ def simulate_choice() -> bool:
     Returns:
         A random choice (bool)
     """
-    return random.random() < 0.5
+    return rand_float() < 0.5
+
+
+@functools.lru_cache(maxsize=None)
+def load_ip_pool() -> Tuple[str, ...]:
+    """ Draws the pool of simulated IP addresses on first use (i.e. not while
+        tests are merely being collected)
+
+    Returns:
+        Simulated IP addresses (tuple(str))
+    """
+    pool_rng = random.Random(IP_POOL_SEED)
+    return tuple(
+        ".".join(map(str, pool_rng.choices(IP_OCTETS, k=4))) 
+        for _ in range(IP_POOL_SIZE)
+    )
 
 
 def simulate_ip() -> str:
@@ -196,12 +386,7 @@ def simulate_ip() -> str:
     Returns:
         A random IP address (str)
     """
-    return "{}.{}.{}.{}".format(
-        random.randint(1, 1000),
-        random.randint(1, 1000),
-        random.randint(1, 1000),
-        random.randint(1, 1000)
-    )
+    return rand_choice(load_ip_pool())
 
 
 def simulate_port() -> int:
@@ -210,7 +395,109 @@ def simulate_port() -> int:
     Returns:
         A random port (int)
     """
-    return random.randint(1001, 65535)
+    return rand_choice(PORTS)
+
+
+def simulate_tags() -> List[List[str]]:
+    """ Simulates a random collection of dataset tags
+
+    Returns:
+        Random dataset tags (list(list(str)))
+    """
+    tag_count = rand_int(1, 10)
+    return [list(tag) for tag in rand_choices(TAG_POOL, k=tag_count)]
+
+
+def simulate_alignment() -> Dict[str, List[int]]:
+    """ Simulates random feature & label alignment indexes
+
+    Returns:
+        Random alignments (dict(str, list(int)))
+    """
+    X_alignments = rand_choices(X_ALIGNMENT_INDEXES, k=rand_int(1, 100))
+    X_alignments.sort()
+    y_alignments = rand_choices(Y_ALIGNMENT_INDEXES, k=rand_int(1, 10))
+    y_alignments.sort()
+    return {'X': X_alignments, 'y': y_alignments}
+
+
+def simulate_float_stats(label_count: int) -> List[float]:
+    """ Simulates a random float statistic for each label
+
+    Args:
+        label_count (int): No. of labels to simulate statistics for
+    Returns:
+        Random float statistics (list(float))
+    """
+    return [rand_float() for _ in range(label_count)]
+
+
+def simulate_int_stats(label_count: int) -> List[int]:
+    """ Simulates a random integer statistic for each label
+
+    Args:
+        label_count (int): No. of labels to simulate statistics for
+    Returns:
+        Random integer statistics (list(int))
+    """
+    return rand_choices(INT_STAT_VALUES, k=label_count)
+
+
+def simulate_uuids(count: int) -> Iterator[uuid.UUID]:
+    """ Simulates a batch of random (version 4) UUIDs, drawing the random bytes
+        for the entire batch in a single read
+
+    Args:
+        count (int): No. of UUIDs to simulate
+    Returns:
+        Random UUIDs (iterator(uuid.UUID))
+    """
+    pool = os.urandom(16 * count)
+    return (
+        uuid.UUID(bytes=pool[offset:offset+16], version=4)
+        for offset in range(0, len(pool), 16)
+    )
+
+
+def construct_id(core_idx: int, uid: uuid.UUID = None) -> str:
+    """ Constructs a unique ID for the specified index
+
+    Args:
+        core_idx (int): Index of entity within its parent hierarchy
+        uid (uuid.UUID): Pre-drawn UUID to use. If not specified, a new UUID
+            will be generated instead.
+    Returns:
+        Unique ID (str)
+    """
+    if uid is None:
+        uid = uuid.uuid4()
+    return f"{core_idx}-{uid}"
+
+
+def build_key_maker(topic: str) -> Callable:
+    """ Specialises key creation for a topic, binding its ID key and prefix
+        upfront so that they need not be looked up for every key created. 
+        Created keys are appended to the topic's (pre-initialised) list.
+
+    Args:
+        topic (str): Topic to generate keys for
+    Returns:
+        Key creation function for topic (Callable)
+    """
+    topic_id_key = ID_KEYS[topic]
+    topic_prefix = PREFIXES[topic]
+
+    def create_key(key_dict, idx, hierarchy, uid=None):
+        topic_id = topic_prefix(construct_id(idx, uid))
+        topic_key = hierarchy.copy()
+        topic_key[topic_id_key] = topic_id
+        key_dict[topic].append(topic_key)
+        return topic_key
+
+    return create_key
+
+
+KEY_MAKERS = {topic: build_key_maker(topic) for topic in PREFIXES}
 
 
 def simulate_setup(
@@ -231,71 +518,87 @@ def simulate_setup(
     Returns:
         All simulated keys (dict)
     """
-    def construct_id(core_idx: int):
-        return "-".join([str(core_idx), str(uuid.uuid4())])
-
-    def update_topic_keys(key_dict, topic, new_key):
-        topic_entries = key_dict.get(topic, [])
-        topic_entries.append(new_key)
-        key_dict.update({topic: topic_entries})
-
-    def create_key(key_dict, topic, idx, hierarchy):
-        topic_prefix = PREFIXES.get(topic)
-        topic_id_key = ID_KEYS.get(topic)
-        topic_id = topic_prefix.substitute({topic_id_key: construct_id(idx)})
-        topic_key = {**hierarchy, topic_id_key: topic_id}
-        update_topic_keys(key_dict, topic, topic_key)
-        return topic_key
+    # Draw UUIDs for all keys to be generated upfront
+    key_count = (
+        collabs * (1 + projects * (1 + experiments * (1 + runs))) + 
+        participants
+    )
+    uids = simulate_uuids(key_count)
 
     # Generate unique collaborations
-    all_keys = {}
+    all_keys = {topic: [] for topic in KEY_MAKERS}
     for collab_idx in range(collabs): 
-        collab_key = create_key(
+        collab_key = KEY_MAKERS["collaboration"](
             key_dict=all_keys, 
-            topic="collaboration", 
             idx=collab_idx, 
-            hierarchy={}
+            hierarchy={},
+            uid=next(uids)
         )
 
         # Generate unique projects
         for project_idx in range(projects):
-            project_key = create_key(
+            project_key = KEY_MAKERS["project"](
                 key_dict=all_keys, 
-                topic="project", 
                 idx=project_idx, 
-                hierarchy=collab_key
+                hierarchy=collab_key,
+                uid=next(uids)
             )
 
             # Generate unique experiments
             for expt_idx in range(experiments):
-                expt_key = create_key(
+                expt_key = KEY_MAKERS["experiment"](
                     key_dict=all_keys, 
-                    topic="experiment", 
                     idx=expt_idx, 
-                    hierarchy=project_key
+                    hierarchy=project_key,
+                    uid=next(uids)
                 )
 
                 # Generate unique runs
                 for run_idx in range(runs):
-                    run_key = create_key(
+                    run_key = KEY_MAKERS["run"](
                         key_dict=all_keys, 
-                        topic="run", 
                         idx=run_idx, 
-                        hierarchy=expt_key
+                        hierarchy=expt_key,
+                        uid=next(uids)
                     )
 
     # Generate unique participants
     for participant_idx in range(participants):
-        participant_key = create_key(
+        participant_key = KEY_MAKERS["participant"](
             key_dict=all_keys, 
-            topic="participant", 
             idx=participant_idx, 
-            hierarchy={}
+            hierarchy={},
+            uid=next(uids)
         )
 
     return all_keys
 
 
+@functools.lru_cache(maxsize=None)
+def load_setup(
+    collabs: int = 2,
+    projects: int = 2,
+    experiments: int = 2,
+    runs: int = 3,
+    participants: int = 5
+) -> Dict[str, List[Dict[str, str]]]:
+    """ Memoised variant of `simulate_setup`, which builds the simulated keys
+        for each unique configuration only once per session. As the same keys
+        are shared by all callers, they are to be treated as read-only (i.e.
+        make a deep copy before mutating them).
+
+    Args:
+        collabs (int): No. of collaborations to simulate
+        projects (int): No. of projects per collab to simulate
+        experiments (int): No. of experiments per project to simulate
+        runs (int): No. of runs per experiment to simulate
+        participants (int): No. of participants per collaboration to simulate
+    Returns:
+        All simulated keys (dict)
+    """
+    return simulate_setup(collabs, projects, experiments, runs, participants)
+
+
 def generate_record_info() -> Tuple[
     str,
     Dict[str, str],
@@ -314,41 +617,37 @@ def generate_record_info() -> Tuple[
     test_key = f"KEY-{uuid.uuid4()}"
     test_ids = {
         f'TEST_ID{i}-{uuid.uuid4()}': f"ID{i}-{uuid.uuid4()}"
-        for i in range(random.randint(1, 5))
+        for i in range(rand_int(1, 5))
     }
     test_info = {
-        'int_field': random.randint(-1000, 1000),
-        'float_field': random.random(),
+        'int_field': rand_int(-1000, 1000),
+        'float_field': rand_float(),
         'str_field': str(uuid.uuid4()),
-        'list_field': [i for i in range(random.randint(1, 10))],
-        'dict_field': {f'key_{i}':i for i in range(random.randint(1, 10))}
+        'list_field': [i for i in range(rand_int(1, 10))],
+        'dict_field': {f'key_{i}':i for i in range(rand_int(1, 10))}
     }
 
     return test_key, test_ids, test_info
 
 
-def generate_federated_combination() -> Tuple[str]:
+def generate_federated_combination() -> FederatedIds:
     """ Generates a federated combination of composite IDs that uniquely 
         documents essential components of a single federated cycle
 
     Returns:
-        Collaboration ID (str)
-        Project ID       (str)
-        Experiment ID    (str)
-        Run ID           (str)
-        Participant ID   (str)
+        Collaboration, project, experiment, run & participant IDs (FederatedIds)
     """
-    test_keys = simulate_setup()
+    test_keys = load_setup()
     
-    federated_combination = random.choice(test_keys['run']) # lowest hierarchy
-    collab_id = federated_combination[ID_KEYS['collaboration']]
-    project_id = federated_combination[ID_KEYS['project']]
-    expt_id = federated_combination[ID_KEYS['experiment']]
-    run_id = federated_combination[ID_KEYS['run']]
+    federated_combination = rand_choice(test_keys['run']) # lowest hierarchy
+    collab_id = federated_combination[COLLAB_ID]
+    project_id = federated_combination[PROJECT_ID]
+    expt_id = federated_combination[EXPT_ID]
+    run_id = federated_combination[RUN_ID]
     
-    participant = random.choice(test_keys['participant'])
-    participant_id = participant.get(ID_KEYS['participant'])
-    return collab_id, project_id, expt_id, run_id, participant_id
+    participant = rand_choice(test_keys['participant'])
+    participant_id = participant.get(PARTICIPANT_ID)
+    return FederatedIds(collab_id, project_id, expt_id, run_id, participant_id)
 
 
 def generate_collaboration_info() -> dict:
@@ -393,10 +692,10 @@ def generate_project_info() -> dict:
     return {
         "universe_alignment": [],
         "incentives": {},
-        "start_at": datetime.strptime(
-            datetime.utcnow().strftime('%Y-%m-%d %H:%M:%S'),
-            '%Y-%m-%d %H:%M:%S'
-        ) + timedelta(hours=random.randint(0, 1000))
+        "start_at": (
+            datetime.utcnow().replace(microsecond=0) + 
+            timedelta(hours=rand_int(0, 1000))
+        )
     }
 
 
@@ -411,8 +710,8 @@ def generate_experiment_info() -> dict:
             {
                 "is_input": True,
                 "structure": {
-                    "in_features": random.randint(1, 1000),
-                    "out_features": random.randint(1, 100),
+                    "in_features": rand_int(1, 1000),
+                    "out_features": rand_int(1, 100),
                     "bias": simulate_choice()
                 },
                 "l_type": "linear",
@@ -429,36 +728,36 @@ def generate_run_info() -> Dict[str, Union[int, float, bool, str]]:
         Run metadata (dict) 
     """
     return {
-        "input_size": random.randint(1, 1000),
-        "output_size": random.randint(1, 100),
-        "batch_size": random.randint(1, 5000),
-        "lr": random.random(),
-        "weight_decay": random.random(),
-        "rounds": random.randint(0, 100),
-        "epochs": random.randint(0, 100),
-        "lr_decay": random.random(),
-        "seed": random.randint(1, 1000),
+        "input_size": rand_int(1, 1000),
+        "output_size": rand_int(1, 100),
+        "batch_size": rand_int(1, 5000),
+        "lr": rand_float(),
+        "weight_decay": rand_float(),
+        "rounds": rand_int(0, 100),
+        "epochs": rand_int(0, 100),
+        "lr_decay": rand_float(),
+        "seed": rand_int(1, 1000),
         "is_condensed": simulate_choice(),
-        "precision_fractional": random.randint(1, 10),
+        "precision_fractional": rand_int(1, 10),
         "use_CLR": simulate_choice(),
-        "mu": random.random(),
-        "reduction": random.choice(["none", "mean", "sum"]),
-        "l1_lambda": random.random(),
-        "l2_lambda": random.random(),
-        "dampening": random.random(),
-        "base_lr": random.random(),
-        "max_lr": random.random(),
-        "step_size_up": random.randint(1, 10),
-        "step_size_down": random.randint(1, 10),
-        "mode": random.choice(["triangular", "triangular2", "exp_range"]),
-        "gamma": random.random(),
-        "scale_mode": random.choice(["cycle", "iterations"]),
+        "mu": rand_float(),
+        "reduction": rand_choice(REDUCTIONS),
+        "l1_lambda": rand_float(),
+        "l2_lambda": rand_float(),
+        "dampening": rand_float(),
+        "base_lr": rand_float(),
+        "max_lr": rand_float(),
+        "step_size_up": rand_int(1, 10),
+        "step_size_down": rand_int(1, 10),
+        "mode": rand_choice(CLR_MODES),
+        "gamma": rand_float(),
+        "scale_mode": rand_choice(CLR_SCALE_MODES),
         "cycle_momentum": simulate_choice(),
-        "base_momentum": random.random(),
-        "max_momentum": random.random(),
-        "last_epoch": random.randint(1, 10),
-        "patience": random.randint(1, 10),
-        "delta": random.random(),
+        "base_momentum": rand_float(),
+        "max_momentum": rand_float(),
+        "last_epoch": rand_int(1, 10),
+        "patience": rand_int(1, 10),
+        "delta": rand_float(),
         "cumulative_delta": simulate_choice()
     }
 
@@ -478,16 +777,16 @@ def generate_registration_info() -> dict:
     Returns:
         Registration metadata (dict) 
     """
-    grid_count = random.randint(1, 10)
+    grid_count = rand_int(1, MAX_GRID_COUNT)
     channels = {
-        f"node_{grid_idx}": {
+        node_key: {
             "host": simulate_ip(),
             "f_port": simulate_port(),
             "port": simulate_port(),
             "log_msgs": simulate_choice(),
             "verbose": simulate_choice()
         } 
-        for grid_idx in range(grid_count)
+        for node_key in NODE_KEYS[:grid_count]
     }
     return {'role': "guest", 'n_count': grid_count, **channels}
 
@@ -498,14 +797,8 @@ def generate_tag_info() -> dict:
     Returns:
         Tag metadata (dict) 
     """
-    def simulate_tag():
-        dataset_name = "test_dataset"
-        dataset_set = f"set_{str(random.randint(0, 10))}"
-        version = f"version_{str(random.randint(0, 10))}"
-        return [dataset_name, dataset_set, version]
-
     return {
-        meta: [simulate_tag() for _ in range(random.randint(1, 10))] 
+        meta: simulate_tags()
         for meta in ["train", "evaluate", "predict"]
     }
 
@@ -516,202 +809,83 @@ def generate_alignment_info() -> dict:
     Returns:
         Alignment metadata (dict) 
     """
-    def simulate_alignment() -> List[int]:
-        X_alignments = sorted([
-            random.randint(0, 1000) 
-            for _ in range(random.randint(1, 100))
-        ])
-        y_alignments = sorted([
-            random.randint(0, 10) 
-            for _ in range(random.randint(1, 10))
-        ])
-        return {'X': X_alignments, 'y': y_alignments}
-
     return {
         meta: simulate_alignment() 
         for meta in ["train", "evaluate", "predict"]
     }
 
 
+def build_model_info(
+    rounds: int = 5, 
+    epochs: int = 2, 
+    participants: int = 2
+) -> dict:
+    """ Builds the checkpoint tree of a simulated model record, comprising of
+        a global model and a local model for each participant
+
+    Args:
+        rounds (int): No. of rounds checkpointed
+        epochs (int): No. of epochs checkpointed per round
+        participants (int): No. of participants contributing local models
+    Returns:
+        Model metadata (dict) 
+    """
+    def build_outputs(out_dir: str, m_type: str, suffix: str) -> dict:
+        return {
+            "loss_history": f"{out_dir}/{m_type}_loss_history{suffix}.json",
+            "path": f"{out_dir}/{m_type}_model{suffix}.pt"
+        }
+
+    def build_model(m_type: str, suffix: str, origin: str) -> dict:
+        checkpoints = {
+            f"round_{r_idx}": {
+                f"epoch_{e_idx}": build_outputs(
+                    out_dir="/".join([
+                        MODEL_OUTPUT_DIR, "checkpoints", 
+                        f"round_{r_idx}", f"epoch_{e_idx}"
+                    ]),
+                    m_type=m_type,
+                    suffix=suffix
+                )
+                for e_idx in range(epochs)
+            }
+            for r_idx in range(rounds)
+        }
+        return {
+            "checkpoints": checkpoints,
+            **build_outputs(MODEL_OUTPUT_DIR, m_type, suffix),
+            "origin": origin
+        }
+
+    model_info = {"global": build_model("global", "", "ttp")}
+    for p_idx in range(1, participants + 1):
+        origin = f"test_participant_{p_idx}"
+        model_info[f"local_{p_idx}"] = build_model(
+            m_type="local", 
+            suffix=f"_{origin}", 
+            origin=origin
+        )
+    return model_info
+
+
+@functools.lru_cache(maxsize=None)
+def load_model_info_json() -> str:
+    """ Serialises the checkpoint tree of a simulated model record once, on 
+        first use, since parsing JSON is cheaper than deep-copying the tree
+
+    Returns:
+        Serialised model metadata (str)
+    """
+    return json.dumps(build_model_info())
+
+
 def generate_model_info() -> dict:
     """ Generates metadata used for creating a model record
 
     Returns:
         Model metadata (dict) 
     """
-    return {
-        "global": {
-            "checkpoints": {
-                "round_0": {
-                    "epoch_0": {
-                        "loss_history": "/ttp/outputs/test_project_1/test_experiment/test_run/checkpoints/round_0/epoch_0/global_loss_history.json",
-                        "path": "/ttp/outputs/test_project_1/test_experiment/test_run/checkpoints/round_0/epoch_0/global_model.pt"
-                    },
-                    "epoch_1": {
-                        "loss_history": "/ttp/outputs/test_project_1/test_experiment/test_run/checkpoints/round_0/epoch_1/global_loss_history.json",
-                        "path": "/ttp/outputs/test_project_1/test_experiment/test_run/checkpoints/round_0/epoch_1/global_model.pt"
-                    }
-                },
-                "round_1": {
-                    "epoch_0": {
-                        "loss_history": "/ttp/outputs/test_project_1/test_experiment/test_run/checkpoints/round_1/epoch_0/global_loss_history.json",
-                        "path": "/ttp/outputs/test_project_1/test_experiment/test_run/checkpoints/round_1/epoch_0/global_model.pt"
-                    },
-                    "epoch_1": {
-                        "loss_history": "/ttp/outputs/test_project_1/test_experiment/test_run/checkpoints/round_1/epoch_1/global_loss_history.json",
-                        "path": "/ttp/outputs/test_project_1/test_experiment/test_run/checkpoints/round_1/epoch_1/global_model.pt"
-                    }
-                },
-                "round_2": {
-                    "epoch_0": {
-                        "loss_history": "/ttp/outputs/test_project_1/test_experiment/test_run/checkpoints/round_2/epoch_0/global_loss_history.json",
-                        "path": "/ttp/outputs/test_project_1/test_experiment/test_run/checkpoints/round_2/epoch_0/global_model.pt"
-                    },
-                    "epoch_1": {
-                        "loss_history": "/ttp/outputs/test_project_1/test_experiment/test_run/checkpoints/round_2/epoch_1/global_loss_history.json",
-                        "path": "/ttp/outputs/test_project_1/test_experiment/test_run/checkpoints/round_2/epoch_1/global_model.pt"
-                    }
-                },
-                "round_3": {
-                    "epoch_0": {
-                        "loss_history": "/ttp/outputs/test_project_1/test_experiment/test_run/checkpoints/round_3/epoch_0/global_loss_history.json",
-                        "path": "/ttp/outputs/test_project_1/test_experiment/test_run/checkpoints/round_3/epoch_0/global_model.pt"
-                    },
-                    "epoch_1": {
-                        "loss_history": "/ttp/outputs/test_project_1/test_experiment/test_run/checkpoints/round_3/epoch_1/global_loss_history.json",
-                        "path": "/ttp/outputs/test_project_1/test_experiment/test_run/checkpoints/round_3/epoch_1/global_model.pt"
-                    }
-                },
-                "round_4": {
-                    "epoch_0": {
-                        "loss_history": "/ttp/outputs/test_project_1/test_experiment/test_run/checkpoints/round_4/epoch_0/global_loss_history.json",
-                        "path": "/ttp/outputs/test_project_1/test_experiment/test_run/checkpoints/round_4/epoch_0/global_model.pt"
-                    },
-                    "epoch_1": {
-                        "loss_history": "/ttp/outputs/test_project_1/test_experiment/test_run/checkpoints/round_4/epoch_1/global_loss_history.json",
-                        "path": "/ttp/outputs/test_project_1/test_experiment/test_run/checkpoints/round_4/epoch_1/global_model.pt"
-                    }
-                }
-            },
-            "loss_history": "/ttp/outputs/test_project_1/test_experiment/test_run/global_loss_history.json",
-            "origin": "ttp",
-            "path": "/ttp/outputs/test_project_1/test_experiment/test_run/global_model.pt"
-        },
-        "local_1": {
-            "checkpoints": {
-                "round_0": {
-                    "epoch_0": {
-                        "loss_history": "/ttp/outputs/test_project_1/test_experiment/test_run/checkpoints/round_0/epoch_0/local_loss_history_test_participant_1.json",
-                        "path": "/ttp/outputs/test_project_1/test_experiment/test_run/checkpoints/round_0/epoch_0/local_model_test_participant_1.pt"
-                    },
-                    "epoch_1": {
-                        "loss_history": "/ttp/outputs/test_project_1/test_experiment/test_run/checkpoints/round_0/epoch_1/local_loss_history_test_participant_1.json",
-                        "path": "/ttp/outputs/test_project_1/test_experiment/test_run/checkpoints/round_0/epoch_1/local_model_test_participant_1.pt"
-                    }
-                },
-                "round_1": {
-                    "epoch_0": {
-                        "loss_history": "/ttp/outputs/test_project_1/test_experiment/test_run/checkpoints/round_1/epoch_0/local_loss_history_test_participant_1.json",
-                        "path": "/ttp/outputs/test_project_1/test_experiment/test_run/checkpoints/round_1/epoch_0/local_model_test_participant_1.pt"
-                    },
-                    "epoch_1": {
-                        "loss_history": "/ttp/outputs/test_project_1/test_experiment/test_run/checkpoints/round_1/epoch_1/local_loss_history_test_participant_1.json",
-                        "path": "/ttp/outputs/test_project_1/test_experiment/test_run/checkpoints/round_1/epoch_1/local_model_test_participant_1.pt"
-                    }
-                },
-                "round_2": {
-                    "epoch_0": {
-                        "loss_history": "/ttp/outputs/test_project_1/test_experiment/test_run/checkpoints/round_2/epoch_0/local_loss_history_test_participant_1.json",
-                        "path": "/ttp/outputs/test_project_1/test_experiment/test_run/checkpoints/round_2/epoch_0/local_model_test_participant_1.pt"
-                    },
-                    "epoch_1": {
-                        "loss_history": "/ttp/outputs/test_project_1/test_experiment/test_run/checkpoints/round_2/epoch_1/local_loss_history_test_participant_1.json",
-                        "path": "/ttp/outputs/test_project_1/test_experiment/test_run/checkpoints/round_2/epoch_1/local_model_test_participant_1.pt"
-                    }
-                },
-                "round_3": {
-                    "epoch_0": {
-                        "loss_history": "/ttp/outputs/test_project_1/test_experiment/test_run/checkpoints/round_3/epoch_0/local_loss_history_test_participant_1.json",
-                        "path": "/ttp/outputs/test_project_1/test_experiment/test_run/checkpoints/round_3/epoch_0/local_model_test_participant_1.pt"
-                    },
-                    "epoch_1": {
-                        "loss_history": "/ttp/outputs/test_project_1/test_experiment/test_run/checkpoints/round_3/epoch_1/local_loss_history_test_participant_1.json",
-                        "path": "/ttp/outputs/test_project_1/test_experiment/test_run/checkpoints/round_3/epoch_1/local_model_test_participant_1.pt"
-                    }
-                },
-                "round_4": {
-                    "epoch_0": {
-                        "loss_history": "/ttp/outputs/test_project_1/test_experiment/test_run/checkpoints/round_4/epoch_0/local_loss_history_test_participant_1.json",
-                        "path": "/ttp/outputs/test_project_1/test_experiment/test_run/checkpoints/round_4/epoch_0/local_model_test_participant_1.pt"
-                    },
-                    "epoch_1": {
-                        "loss_history": "/ttp/outputs/test_project_1/test_experiment/test_run/checkpoints/round_4/epoch_1/local_loss_history_test_participant_1.json",
-                        "path": "/ttp/outputs/test_project_1/test_experiment/test_run/checkpoints/round_4/epoch_1/local_model_test_participant_1.pt"
-                    }
-                }
-            },
-            "loss_history": "/ttp/outputs/test_project_1/test_experiment/test_run/local_loss_history_test_participant_1.json",
-            "origin": "test_participant_1",
-            "path": "/ttp/outputs/test_project_1/test_experiment/test_run/local_model_test_participant_1.pt"
-        },
-        "local_2": {
-            "checkpoints": {
-                "round_0": {
-                    "epoch_0": {
-                        "loss_history": "/ttp/outputs/test_project_1/test_experiment/test_run/checkpoints/round_0/epoch_0/local_loss_history_test_participant_2.json",
-                        "path": "/ttp/outputs/test_project_1/test_experiment/test_run/checkpoints/round_0/epoch_0/local_model_test_participant_2.pt"
-                    },
-                    "epoch_1": {
-                        "loss_history": "/ttp/outputs/test_project_1/test_experiment/test_run/checkpoints/round_0/epoch_1/local_loss_history_test_participant_2.json",
-                        "path": "/ttp/outputs/test_project_1/test_experiment/test_run/checkpoints/round_0/epoch_1/local_model_test_participant_2.pt"
-                    }
-                },
-                "round_1": {
-                    "epoch_0": {
-                        "loss_history": "/ttp/outputs/test_project_1/test_experiment/test_run/checkpoints/round_1/epoch_0/local_loss_history_test_participant_2.json",
-                        "path": "/ttp/outputs/test_project_1/test_experiment/test_run/checkpoints/round_1/epoch_0/local_model_test_participant_2.pt"
-                    },
-                    "epoch_1": {
-                        "loss_history": "/ttp/outputs/test_project_1/test_experiment/test_run/checkpoints/round_1/epoch_1/local_loss_history_test_participant_2.json",
-                        "path": "/ttp/outputs/test_project_1/test_experiment/test_run/checkpoints/round_1/epoch_1/local_model_test_participant_2.pt"
-                    }
-                },
-                "round_2": {
-                    "epoch_0": {
-                        "loss_history": "/ttp/outputs/test_project_1/test_experiment/test_run/checkpoints/round_2/epoch_0/local_loss_history_test_participant_2.json",
-                        "path": "/ttp/outputs/test_project_1/test_experiment/test_run/checkpoints/round_2/epoch_0/local_model_test_participant_2.pt"
-                    },
-                    "epoch_1": {
-                        "loss_history": "/ttp/outputs/test_project_1/test_experiment/test_run/checkpoints/round_2/epoch_1/local_loss_history_test_participant_2.json",
-                        "path": "/ttp/outputs/test_project_1/test_experiment/test_run/checkpoints/round_2/epoch_1/local_model_test_participant_2.pt"
-                    }
-                },
-                "round_3": {
-                    "epoch_0": {
-                        "loss_history": "/ttp/outputs/test_project_1/test_experiment/test_run/checkpoints/round_3/epoch_0/local_loss_history_test_participant_2.json",
-                        "path": "/ttp/outputs/test_project_1/test_experiment/test_run/checkpoints/round_3/epoch_0/local_model_test_participant_2.pt"
-                    },
-                    "epoch_1": {
-                        "loss_history": "/ttp/outputs/test_project_1/test_experiment/test_run/checkpoints/round_3/epoch_1/local_loss_history_test_participant_2.json",
-                        "path": "/ttp/outputs/test_project_1/test_experiment/test_run/checkpoints/round_3/epoch_1/local_model_test_participant_2.pt"
-                    }
-                },
-                "round_4": {
-                    "epoch_0": {
-                        "loss_history": "/ttp/outputs/test_project_1/test_experiment/test_run/checkpoints/round_4/epoch_0/local_loss_history_test_participant_2.json",
-                        "path": "/ttp/outputs/test_project_1/test_experiment/test_run/checkpoints/round_4/epoch_0/local_model_test_participant_2.pt"
-                    },
-                    "epoch_1": {
-                        "loss_history": "/ttp/outputs/test_project_1/test_experiment/test_run/checkpoints/round_4/epoch_1/local_loss_history_test_participant_2.json",
-                        "path": "/ttp/outputs/test_project_1/test_experiment/test_run/checkpoints/round_4/epoch_1/local_model_test_participant_2.pt"
-                    }
-                }
-            },
-            "loss_history": "/ttp/outputs/test_project_1/test_experiment/test_run/local_loss_history_test_participant_2.json",
-            "origin": "test_participant_2",
-            "path": "/ttp/outputs/test_project_1/test_experiment/test_run/local_model_test_participant_2.pt"
-        }
-    }
+    return json.loads(load_model_info_json())
 
 
 def generate_mlflow_info() -> Tuple[Dict[str, str]]:
@@ -721,23 +895,7 @@ def generate_mlflow_info() -> Tuple[Dict[str, str]]:
         MLFlow experiment metadata (dict) 
         MLFlow run metadata        (dict)
     """
-    expt_tracked = {
-        "mlflow_id": "0",
-        "mlflow_type": "experiment",
-        "mlflow_uri": "/ttp/mlflow/test_collab/test_project_1",
-        "name": "test_experiment",
-        "project": "test_project_1",
-        "collaboration": "test_collab"
-    }
-    run_tracked = {
-        "mlflow_id": "f81c4ff2c4704a0da07da1d16b4dfe9e",
-        "mlflow_type": "run",
-        "mlflow_uri": "/ttp/mlflow/test_collab/test_project_1",
-        "name": "test_run",
-        "project": "test_project_1",
-        "collaboration": "test_collab"
-    }
-    return expt_tracked, run_tracked
+    return dict(MLFLOW_EXPT_INFO), dict(MLFLOW_RUN_INFO)
 
 
 def generate_inference_info(
@@ -750,56 +908,186 @@ def generate_inference_info(
     Returns:
         Inference metadata (dict) 
     """
-    def simulate_float_stats():
-        return [random.random() for _ in range(label_count)]
-
-    def simulate_int_stats():
-        return [random.randint(0, 5000) for _ in range(label_count)]
-
-    classification_stats = {
-        "FDRs": simulate_float_stats(),
-        "FNRs": simulate_float_stats(),
-        "FNs": simulate_int_stats(),
-        "FPRs": simulate_float_stats(),
-        "FPs": simulate_int_stats(),
-        "NPVs": simulate_float_stats(),
-        "PPVs": simulate_float_stats(),
-        "TNRs": simulate_float_stats(),
-        "TNs": simulate_int_stats(),
-        "TPRs": simulate_float_stats(),
-        "TPs": simulate_int_stats(),
-        "accuracy": simulate_float_stats(),
-        "f_score": simulate_float_stats(),
-        "pr_auc_score": simulate_float_stats(),
-        "roc_auc_score": simulate_float_stats()
-    }
-
-    regression_stats = {
-        'R2': random.random(),
-        'MSE': random.random(), 
-        'MAE': random.random()
-    }
+    # Only simulate the statistics that are relevant to the specified action
+    if action == "regress":
+        statistics = {
+            'R2': rand_float(),
+            'MSE': rand_float(), 
+            'MAE': rand_float()
+        }
+    else:
+        statistics = {
+            "FDRs": simulate_float_stats(label_count),
+            "FNRs": simulate_float_stats(label_count),
+            "FNs": simulate_int_stats(label_count),
+            "FPRs": simulate_float_stats(label_count),
+            "FPs": simulate_int_stats(label_count),
+            "NPVs": simulate_float_stats(label_count),
+            "PPVs": simulate_float_stats(label_count),
+            "TNRs": simulate_float_stats(label_count),
+            "TNs": simulate_int_stats(label_count),
+            "TPRs": simulate_float_stats(label_count),
+            "TPs": simulate_int_stats(label_count),
+            "accuracy": simulate_float_stats(label_count),
+            "f_score": simulate_float_stats(label_count),
+            "pr_auc_score": simulate_float_stats(label_count),
+            "roc_auc_score": simulate_float_stats(label_count)
+        }
 
     return {
         meta: {
             "res_path": f"/worker/outputs/test_collaboration/test_project/test_experiment/test_run/{meta}/inference_statistics_{meta}.json",
-            "statistics": (
-                regression_stats 
-                if action == "regress" 
-                else classification_stats
-            )
+            "statistics": statistics
         }
     }
 
 
+@functools.lru_cache(maxsize=None)
+def load_filler_info(generator: Callable, *args) -> dict:
+    """ Memoised variant of the `generate_*_info` functions, for records that
+        only populate the hierarchy surrounding the records under test (i.e.
+        their details are never compared). Each unique generator/argument 
+        combination is only simulated once per session, so the payloads
+        returned are shared & are to be treated as read-only.
+
+    Args:
+        generator (Callable): Generator of the metadata to be simulated
+        *args: Positional arguments to be passed to the generator
+    Returns:
+        Shared metadata (dict)
+    """
+    return generator(*args)
+
+
+def get_records(records_class: Type[Records]) -> Records:
+    """ Retrieves a shared archive of the specified class that is bound to the
+        test database, instantiating it only on first request
+
+    Args:
+        records_class (type): Class of archive to be retrieved
+    Returns:
+        Shared archive (Records)
+    """
+    registry_key = (records_class, TEST_PATH)
+    if registry_key not in RECORDS_REGISTRY:
+        RECORDS_REGISTRY[registry_key] = records_class(db_path=TEST_PATH)
+    return RECORDS_REGISTRY[registry_key]
+
+
 def reset_database(archive: Records) -> None:
     """ Erases all existing data stored in an archive's database
 
     Args:
         archive (Records): Specified archive to be resetted
     """
-    database = archive.load_database()
-    database.purge()
+    TEST_STORAGE.discard(archive.db_path)
+
+
+def populate_hierarchy(
+    topics: Tuple[str, ...], 
+    federated_combination: Tuple[str, ...],
+    action: str = None
+) -> Tuple[Records, ...]:
+    """ Creates a filler record for each specified topic, in the order given,
+        all of which are bound to the same federated combination. This builds
+        the hierarchy surrounding the records under test in an env fixture.
+
+    Args:
+        topics (tuple(str)): Topics to populate (i.e. keys of ID_KEYS)
+        federated_combination (tuple(str)): Collaboration, project, 
+            experiment, run & participant IDs (in that order)
+        action (str): ML action to simulate inference statistics for. Only 
+            required when populating "validation" or "prediction"
+    Returns:
+        Archives of the populated topics, in the order given (tuple(Records))
+    """
+    (collab_id, project_id, expt_id, run_id, participant_id
+    ) = federated_combination
+
+    project_ids = {'collab_id': collab_id, 'project_id': project_id}
+    expt_ids = {**project_ids, 'expt_id': expt_id}
+    run_ids = {**expt_ids, 'run_id': run_id}
+    inference_ids = {'participant_id': participant_id, **run_ids}
+    participation_ids = {**project_ids, 'participant_id': participant_id}
+    
+    fillers = {
+        'collaboration': (
+            CollaborationRecords, {'collab_id': collab_id}, 
+            lambda: load_filler_info(generate_collaboration_info)
+        ),
+        'project': (
+            ProjectRecords, project_ids, 
+            lambda: load_filler_info(generate_project_info)
+        ),
+        'experiment': (
+            ExperimentRecords, expt_ids,
+            lambda: load_filler_info(generate_experiment_info)
+        ),
+        'run': (
+            RunRecords, run_ids,
+            lambda: load_filler_info(generate_run_info)
+        ),
+        'model': (
+            ModelRecords, run_ids,
+            lambda: load_filler_info(generate_model_info)
+        ),
+        'validation': (
+            ValidationRecords, inference_ids,
+            lambda: load_filler_info(
+                generate_inference_info, action, 10, "evaluate"
+            )
+        ),
+        'prediction': (
+            PredictionRecords, inference_ids,
+            lambda: load_filler_info(
+                generate_inference_info, action, 10, "predict"
+            )
+        ),
+        'participant': (
+            ParticipantRecords, {'participant_id': participant_id},
+            lambda: {
+                'id': participant_id, 
+                **load_filler_info(generate_participant_info)
+            }
+        ),
+        'registration': (
+            RegistrationRecords, participation_ids,
+            lambda: load_filler_info(generate_registration_info)
+        ),
+        'tag': (
+            TagRecords, participation_ids,
+            lambda: load_filler_info(generate_tag_info)
+        ),
+        'alignment': (
+            AlignmentRecords, participation_ids,
+            lambda: load_filler_info(generate_alignment_info)
+        )
+    }
+
+    populated_archives = []
+    for topic in topics:
+        records_class, ids, generate_details = fillers[topic]
+        archive = get_records(records_class)
+        archive.create(**ids, details=generate_details())
+        populated_archives.append(archive)
+
+    return tuple(populated_archives)
+
+
+def strip_metadata(record: dict) -> dict:
+    """ Projects a record onto its specified details, by leaving out all 
+        archive-generated fields in a single pass
+
+    Args:
+        record (dict): Record to be projected
+    Returns:
+        Details of record (dict)
+    """
+    return {
+        field: value 
+        for field, value in record.items() 
+        if field not in QUERIED_FIELDS
+    }
 
 
 ########################
@@ -873,7 +1161,7 @@ def check_insertion_or_update(
 def check_key_equivalence(
     record: tinydb.database.Document, 
     r_type: str,
-    ids: List[str]
+    ids: Union[List[str], FrozenSet[str]]
 ) -> None:
     """ Tests if specified record is dynamic while being uniquely identifiable
 
@@ -884,20 +1172,21 @@ def check_key_equivalence(
 
     Args:
         record (tinydb.database.Document):
-        ids (list(str)): List of IDs that make up record's composite key 
+        ids (list(str)): List of IDs that make up record's composite key. 
+            Callers checking many records against the same IDs may pass a
+            precomputed frozenset to skip rebuilding it on every check.
     """
-    # Ensure that a cloned record is no different from its original
-    cloned_record = copy.deepcopy(record)
-    assert cloned_record == record
     # C1
-    assert 'created_at' in cloned_record.keys()
+    assert 'created_at' in record.keys()
     # C2
-    assert "key" in cloned_record.keys()
+    assert "key" in record.keys()
     # C3
-    key = cloned_record.pop('key')
-    assert (set(key.keys()) == set(KEY_ID_MAPPINGS[r_type]))
+    key = record['key']
+    assert key.keys() == RECORD_SPECS[r_type].key
     # C4
-    assert set(ids) == set(key.values())
+    if not isinstance(ids, frozenset):
+        ids = frozenset(ids)
+    assert ids == frozenset(key.values())
 
 
 def check_relation_equivalence(
@@ -911,14 +1200,11 @@ def check_relation_equivalence(
     # C1: Check hierarchy-enforcing field "relations" exist
     # C2: Check that all downstream relations have been captured 
     """
-    # Ensure that a cloned record is no different from its original
-    cloned_record = copy.deepcopy(record)
-    assert cloned_record == record
     # C1
-    assert 'relations' in cloned_record.keys()
+    assert 'relations' in record.keys()
     # C2
-    relations = cloned_record.pop('relations')
-    assert (set(relations.keys()) == set(RELATIONS_MAPPINGS[r_type]))
+    relations = record['relations']
+    assert relations.keys() == RECORD_SPECS[r_type].relations
 
 
 def check_link_equivalence(
@@ -934,17 +1220,56 @@ def check_link_equivalence(
     # C2: Check that the appropriate linked IDs are specified
     # C3: Check that keys in "link" are disjointed sets w.r.t "key" 
     """
-    # Ensure that a cloned record is no different from its original
-    cloned_record = copy.deepcopy(record)
-    assert cloned_record == record
     # C1
     assert "link" in record.keys()
     # C2
-    key = cloned_record.pop('key')
-    link = cloned_record.pop('link')
-    assert (set(link.keys()) == set(LINK_ID_MAPPINGS[r_type]))
+    key = record['key']
+    link = record['link']
+    assert link.keys() == RECORD_SPECS[r_type].link
+    # C3 (values are only compared if every link key also exists in key)
+    if link.keys() <= key.keys():
+        assert any(link[k] != key[k] for k in link)
+
+
+def check_record_equivalence(
+    record: tinydb.database.Document,
+    r_type: str,
+    ids: Union[List[str], FrozenSet[str]]
+) -> None:
+    """ Fused form of the key, link & relation checks, for queried association
+        records (i.e. obtained through .read(...), .read_all(...)). Each field
+        is fetched once and compared against the record type's spec.
+
+    # C1: Check that record was dynamically created, with "key", "relations" &
+          "link" fields
+    # C2: Check that specified record was archived with correct substituent keys
+    # C3: Check that specified record was archived with correct substituent IDs
+    # C4: Check that all downstream relations have been captured 
+    # C5: Check that the appropriate linked IDs are specified
+    # C6: Check that keys in "link" are disjointed sets w.r.t "key" 
+
+    Args:
+        record (tinydb.database.Document):
+        r_type (str): Type of record checked (i.e. key of RECORD_SPECS)
+        ids (list(str)): List of IDs that make up record's composite key
+    """
+    # C1
+    assert QUERIED_FIELDS <= record.keys()
+    key, relations, link = get_queried_fields(record)
+    spec = RECORD_SPECS[r_type]
+    # C2
+    assert key.keys() == spec.key
     # C3
-    assert not set(link.items()).issubset(set(key.items()))
+    if not isinstance(ids, frozenset):
+        ids = frozenset(ids)
+    assert ids == frozenset(key.values())
+    # C4
+    assert relations.keys() == spec.relations
+    # C5
+    assert link.keys() == spec.link
+    # C6
+    if link.keys() <= key.keys():
+        assert any(link[k] != key[k] for k in link)
 
 
 def check_detail_equivalence(
@@ -955,21 +1280,82 @@ def check_detail_equivalence(
 
     # C1: Check that specified record captured the correct specified details
     """
-    # Ensure that a cloned record is no different from its original
-    cloned_record = copy.deepcopy(record)
-    assert cloned_record == record
     # C1
-    cloned_record.pop('created_at')
-    cloned_record.pop('key')
-    cloned_record.pop('link', None)       # Only AssociationRecords has this!
-    cloned_record.pop('relations', None)  # Only .read & .read_all has this!
-    assert details == cloned_record
+    assert {'created_at', 'key'} <= record.keys()
+    assert details == strip_metadata(record)
+
+
+################
+# Pytest Hooks #
+################
+
+def pytest_addoption(parser):
+    parser.addoption(
+        "--on-disk",
+        action="store_true",
+        help=(
+            "Persist test databases as JSON on disk at session end "
+            f"(i.e. {TEST_PATH})"
+        )
+    )
+    parser.addoption(
+        "--seed",
+        type=int,
+        default=None,
+        help=(
+            "Seed for simulated test data, to reproduce the values drawn in a "
+            "previous session (UUID-based IDs & keys are not seeded)"
+        )
+    )
+
+
+def pytest_configure(config):
+    # pytest-xdist workers adopt the seed drawn by the controller, so that the
+    # seed reported in the header reproduces the whole distributed session
+    workerinput = getattr(config, "workerinput", None)
+    if workerinput is not None:
+        config.option.seed = workerinput["seed"]
+    elif config.option.seed is None:
+        config.option.seed = random.randrange(2**32)
+    RNG.seed(config.option.seed)
+
+
+@pytest.hookimpl(optionalhook=True)
+def pytest_configure_node(node):
+    node.workerinput["seed"] = node.config.option.seed
+
+
+def pytest_report_header(config):
+    return f"simulated data seed: {config.option.seed}"
 
 
 ##########################
 # Miscellaneous Fixtures #
 ##########################
 
+@pytest.fixture(scope='session', autouse=True)
+def test_storage(request):
+    """ Backs all archives with in-memory storage for the test session. If 
+        on-disk persistence is requested via `--on-disk`, databases are only
+        written out once, at the end of the session
+    """
+    original_storage = Records.storage_class
+    Records.storage_class = TEST_STORAGE
+    yield TEST_STORAGE
+    Records.storage_class = original_storage
+
+    if request.config.getoption("--on-disk"):
+        TEST_STORAGE.flush()
+
+
+@pytest.fixture(scope='session')
+def federated_ids():
+    """ Federated combination of IDs shared by all env fixtures. As each env
+        fixture resets the test database before seeding it, the same IDs can 
+        be reused throughout the session
+    """
+    return generate_federated_combination()
+
 
 ######################
 # Component Fixtures #
@@ -977,7 +1363,7 @@ def check_detail_equivalence(
 
 @pytest.fixture(scope='session')
 def record_env():
-    records = Records(db_path=TEST_PATH)
+    records = get_records(Records)
     reset_database(records)
 
     test_subject = "RecordTest"
@@ -994,11 +1380,11 @@ def record_env():
 @pytest.fixture(scope='session')
 def topicalRecord_env():
     test_subject = "TopicalTest"
-    test_relations = [f"RELATION-{i}" for i in range(random.randint(1, 10))]
+    test_relations = [f"RELATION-{i}" for i in range(rand_int(1, 10))]
     _, test_ids, test_details = generate_record_info()
     _, _, test_updates = generate_record_info()
     test_key = "key"
-    test_identifier = random.choice(list(test_ids.keys()))
+    test_identifier = rand_choice(list(test_ids.keys()))
 
     topical_records = TopicalRecords(
         test_subject,
@@ -1009,7 +1395,7 @@ def topicalRecord_env():
     reset_database(topical_records)
 
     # Set up related records
-    records = Records(db_path=TEST_PATH)
+    records = get_records(Records)
     related_entries = {}
     for relation in test_relations:
         _, related_ids, related_details = generate_record_info()
@@ -1037,7 +1423,7 @@ def associationRecord_env():
 
     # Generate Downstream & Upstream hierarchy
     SUBJECT_PREFIX = "AssociationTest"
-    hierarchy = [f"{SUBJECT_PREFIX}-{i}" for i in range(random.randint(1, 10))]
+    hierarchy = [f"{SUBJECT_PREFIX}-{i}" for i in range(rand_int(1, 10))]
     associated_record_hierarchy = []
     for idx in range(len(hierarchy)):
         associated_subject = hierarchy[idx]
@@ -1059,7 +1445,7 @@ def associationRecord_env():
         level = (associated_records, associated_details, associated_updates)
         associated_record_hierarchy.append(level)
 
-    records = Records(db_path=TEST_PATH)
+    records = get_records(Records)
 
     return (
         test_key, test_link, test_ids, 
@@ -1069,564 +1455,312 @@ def associationRecord_env():
 
 
 @pytest.fixture(scope='session')
-def collab_env():
-    collab_records = CollaborationRecords(db_path=TEST_PATH)
+def collab_env(federated_ids):
+    collab_records = get_records(CollaborationRecords)
     reset_database(collab_records)
 
     # Simulate data
     collab_details = generate_collaboration_info() 
     collab_updates = generate_collaboration_info()
 
-    (collab_id, project_id, expt_id, run_id, participant_id
-    ) = generate_federated_combination()
-
-    action = random.choice(["classify", "regress"])
-
-    # Generate downstream hierarchy
-    project_records = ProjectRecords(db_path=TEST_PATH)
-    project_records.create(
-        collab_id=collab_id,
-        project_id=project_id,
-        details=generate_project_info()
-    )
-    expt_records = ExperimentRecords(db_path=TEST_PATH)
-    expt_records.create(
-        collab_id=collab_id,
-        project_id=project_id,
-        expt_id=expt_id, 
-        details=generate_experiment_info()
-    )
-    run_records = RunRecords(db_path=TEST_PATH)
-    run_records.create(
-        collab_id=collab_id,
-        project_id=project_id,
-        expt_id=expt_id, 
-        run_id=run_id,
-        details=generate_run_info()
-    )
-    model_records = ModelRecords(db_path=TEST_PATH)
-    model_records.create( 
-        collab_id=collab_id, 
-        project_id=project_id, 
-        expt_id=expt_id, 
-        run_id=run_id,
-        details=generate_model_info()
-    )
-    val_records = ValidationRecords(db_path=TEST_PATH)
-    val_records.create(
-        participant_id=participant_id, 
-        collab_id=collab_id, 
-        project_id=project_id, 
-        expt_id=expt_id, 
-        run_id=run_id,
-        details=generate_inference_info(action, 10, "evaluate")
-    )
-    pred_records = PredictionRecords(db_path=TEST_PATH)
-    pred_records.create(
-        participant_id=participant_id, 
-        collab_id=collab_id, 
-        project_id=project_id, 
-        expt_id=expt_id, 
-        run_id=run_id,
-        details=generate_inference_info(action, 10, "predict")
-    )
+    action = rand_choice(ACTIONS)
 
-    # Generate upstream hierarchy
-    registration_records = RegistrationRecords(db_path=TEST_PATH)
-    registration_records.create(
-        collab_id=collab_id,
-        project_id=project_id,
-        participant_id=participant_id,
-        details=generate_registration_info()
-    )
-    tag_records = TagRecords(db_path=TEST_PATH)
-    tag_records.create( 
-        collab_id=collab_id, 
-        project_id=project_id,
-        participant_id=participant_id, 
-        details=generate_tag_info()
-    )
-    alignment_records = AlignmentRecords(db_path=TEST_PATH)
-    alignment_records.create( 
-        collab_id=collab_id, 
-        project_id=project_id,
-        participant_id=participant_id, 
-        details=generate_alignment_info()
+    # Generate downstream & upstream hierarchy
+    hierarchy_records = populate_hierarchy(
+        TRAINING_TOPICS + PARTICIPATION_TOPICS,
+        federated_ids,
+        action
     )
 
-    return (
-        collab_records, 
-        collab_details,
-        collab_updates,
-        (collab_id, project_id, expt_id, run_id, participant_id),
-        (project_records, expt_records, run_records, model_records, 
-         val_records, pred_records,
-         registration_records, tag_records, alignment_records)
+    return EnvBundle(
+        records=collab_records,
+        details=collab_details,
+        updates=collab_updates,
+        ids=federated_ids,
+        hierarchy=hierarchy_records
     )
 
 
 @pytest.fixture(scope='session')
-def project_env():
-    project_records = ProjectRecords(db_path=TEST_PATH)
+def project_env(federated_ids):
+    project_records = get_records(ProjectRecords)
     reset_database(project_records)
 
     # Simulate data
     project_details = generate_project_info() 
     project_updates = generate_project_info()
 
-    (collab_id, project_id, expt_id, run_id, participant_id
-    ) = generate_federated_combination()
-
-    action = random.choice(["classify", "regress"])
+    action = rand_choice(ACTIONS)
 
     # Generate downstream hierarchy
-    expt_records = ExperimentRecords(db_path=TEST_PATH)
-    expt_records.create(
-        collab_id=collab_id,
-        project_id=project_id,
-        expt_id=expt_id, 
-        details=generate_experiment_info()
-    )
-    run_records = RunRecords(db_path=TEST_PATH)
-    run_records.create(
-        collab_id=collab_id,
-        project_id=project_id,
-        expt_id=expt_id, 
-        run_id=run_id,
-        details=generate_run_info()
-    )
-    model_records = ModelRecords(db_path=TEST_PATH)
-    model_records.create( 
-        collab_id=collab_id, 
-        project_id=project_id, 
-        expt_id=expt_id, 
-        run_id=run_id,
-        details=generate_model_info()
-    )
-    val_records = ValidationRecords(db_path=TEST_PATH)
-    val_records.create(
-        participant_id=participant_id, 
-        collab_id=collab_id, 
-        project_id=project_id, 
-        expt_id=expt_id, 
-        run_id=run_id,
-        details=generate_inference_info(action, 10, "evaluate")
-    )
-    pred_records = PredictionRecords(db_path=TEST_PATH)
-    pred_records.create(
-        participant_id=participant_id, 
-        collab_id=collab_id, 
-        project_id=project_id, 
-        expt_id=expt_id, 
-        run_id=run_id,
-        details=generate_inference_info(action, 10, "predict")
+    downstream_records = populate_hierarchy(
+        TRAINING_TOPICS[1:], 
+        federated_ids, 
+        action
     )
 
-    return (
-        project_records, 
-        project_details,
-        project_updates,
-        (collab_id, project_id, expt_id, run_id, participant_id),
-        (expt_records, run_records, model_records, val_records, pred_records)
+    return EnvBundle(
+        records=project_records,
+        details=project_details,
+        updates=project_updates,
+        ids=federated_ids,
+        hierarchy=downstream_records
     )
 
 
 @pytest.fixture(scope='session')
-def experiment_env():
-    expt_records = ExperimentRecords(db_path=TEST_PATH)
+def experiment_env(federated_ids):
+    expt_records = get_records(ExperimentRecords)
     reset_database(expt_records)
 
     # Simulate data
     expt_details = generate_experiment_info() 
     expt_updates = generate_experiment_info()
 
-    (collab_id, project_id, expt_id, run_id, participant_id
-    ) = generate_federated_combination()
-
-    action = random.choice(["classify", "regress"])
+    action = rand_choice(ACTIONS)
 
     # Generate downstream hierarchy
-    run_records = RunRecords(db_path=TEST_PATH)
-    run_records.create(
-        collab_id=collab_id,
-        project_id=project_id,
-        expt_id=expt_id, 
-        run_id=run_id,
-        details=generate_run_info()
-    )
-    model_records = ModelRecords(db_path=TEST_PATH)
-    model_records.create( 
-        collab_id=collab_id, 
-        project_id=project_id, 
-        expt_id=expt_id, 
-        run_id=run_id,
-        details=generate_model_info()
-    )
-    val_records = ValidationRecords(db_path=TEST_PATH)
-    val_records.create(
-        participant_id=participant_id, 
-        collab_id=collab_id, 
-        project_id=project_id, 
-        expt_id=expt_id, 
-        run_id=run_id,
-        details=generate_inference_info(action, 10, "evaluate")
-    )
-    pred_records = PredictionRecords(db_path=TEST_PATH)
-    pred_records.create(
-        participant_id=participant_id, 
-        collab_id=collab_id, 
-        project_id=project_id, 
-        expt_id=expt_id, 
-        run_id=run_id,
-        details=generate_inference_info(action, 10, "predict")
+    downstream_records = populate_hierarchy(
+        TRAINING_TOPICS[2:], 
+        federated_ids, 
+        action
     )
 
-    return (
-        expt_records, 
-        expt_details,
-        expt_updates,
-        (collab_id, project_id, expt_id, run_id, participant_id),
-        (run_records, model_records, val_records, pred_records)
+    return EnvBundle(
+        records=expt_records,
+        details=expt_details,
+        updates=expt_updates,
+        ids=federated_ids,
+        hierarchy=downstream_records
     )
 
 
 @pytest.fixture(scope='session')
-def run_env():
-    run_records = RunRecords(db_path=TEST_PATH)
+def run_env(federated_ids):
+    run_records = get_records(RunRecords)
     reset_database(run_records)
 
     # Simulate data
     run_details = generate_run_info() 
     run_updates = generate_run_info()
 
-    (collab_id, project_id, expt_id, run_id, participant_id
-    ) = generate_federated_combination()
-
-    action = random.choice(["classify", "regress"])
+    action = rand_choice(ACTIONS)
 
     # Generate downstream hierarchy
-    model_records = ModelRecords(db_path=TEST_PATH)
-    model_records.create( 
-        collab_id=collab_id, 
-        project_id=project_id, 
-        expt_id=expt_id, 
-        run_id=run_id,
-        details=generate_model_info()
-    )
-    val_records = ValidationRecords(db_path=TEST_PATH)
-    val_records.create(
-        participant_id=participant_id, 
-        collab_id=collab_id, 
-        project_id=project_id, 
-        expt_id=expt_id, 
-        run_id=run_id,
-        details=generate_inference_info(action, 10, "evaluate")
-    )
-    pred_records = PredictionRecords(db_path=TEST_PATH)
-    pred_records.create(
-        participant_id=participant_id, 
-        collab_id=collab_id, 
-        project_id=project_id, 
-        expt_id=expt_id, 
-        run_id=run_id,
-        details=generate_inference_info(action, 10, "predict")
+    downstream_records = populate_hierarchy(
+        TRAINING_TOPICS[3:], 
+        federated_ids, 
+        action
     )
 
-    return (
-        run_records, 
-        run_details,
-        run_updates,
-        (collab_id, project_id, expt_id, run_id, participant_id),
-        (model_records, val_records, pred_records)
+    return EnvBundle(
+        records=run_records,
+        details=run_details,
+        updates=run_updates,
+        ids=federated_ids,
+        hierarchy=downstream_records
     )
 
 
 @pytest.fixture(scope='session')
-def model_env():
-    model_records = ModelRecords(db_path=TEST_PATH)
+def model_env(federated_ids):
+    model_records = get_records(ModelRecords)
     reset_database(model_records)
 
     # Simulate data
     model_details = generate_model_info() 
     model_updates = generate_model_info()
 
-    (collab_id, project_id, expt_id, run_id, participant_id
-    ) = generate_federated_combination()
-
-    action = random.choice(["classify", "regress"])
-
-    return (
-        model_records, 
-        model_details,
-        model_updates,
-        (collab_id, project_id, expt_id, run_id, participant_id)
+    return EnvBundle(
+        records=model_records,
+        details=model_details,
+        updates=model_updates,
+        ids=federated_ids,
+        hierarchy=()
     )
 
 
 @pytest.fixture(scope='session')
-def mlf_env():
-    mlf_records = MLFRecords(db_path=TEST_PATH)
+def mlf_env(federated_ids):
+    mlf_records = get_records(MLFRecords)
     reset_database(mlf_records)
 
     # Simulate data
     mlf_expt_details, mlf_run_details = generate_mlflow_info()
     mlf_expt_updates, mlf_run_updates = generate_mlflow_info() 
 
-    (collab_id, project_id, expt_id, run_id, participant_id
-    ) = generate_federated_combination()
-
-    return (
-        mlf_records, 
-        (mlf_expt_details, mlf_run_details),
-        (mlf_expt_updates, mlf_run_updates),
-        (collab_id, project_id, expt_id, run_id, participant_id)
+    return EnvBundle(
+        records=mlf_records,
+        details=(mlf_expt_details, mlf_run_details),
+        updates=(mlf_expt_updates, mlf_run_updates),
+        ids=federated_ids,
+        hierarchy=()
     )
 
 
 @pytest.fixture(scope='session')
-def validation_env():
-    val_records = ValidationRecords(db_path=TEST_PATH)
+def validation_env(federated_ids):
+    val_records = get_records(ValidationRecords)
     reset_database(val_records)
 
     # Simulate data
-    action = random.choice(["classify", "regress"])
+    action = rand_choice(ACTIONS)
     validation_details = generate_inference_info(action, 10, "evaluate") 
     validation_updates = generate_inference_info(action, 10, "evaluate") 
 
-    (collab_id, project_id, expt_id, run_id, participant_id
-    ) = generate_federated_combination()
-
-    return (
-        val_records, 
-        validation_details,
-        validation_updates,
-        (collab_id, project_id, expt_id, run_id, participant_id)
+    return EnvBundle(
+        records=val_records,
+        details=validation_details,
+        updates=validation_updates,
+        ids=federated_ids,
+        hierarchy=()
     )
 
 
 @pytest.fixture(scope='session')
-def prediction_env():
-    pred_records = PredictionRecords(db_path=TEST_PATH)
+def prediction_env(federated_ids):
+    pred_records = get_records(PredictionRecords)
     reset_database(pred_records)
 
     # Simulate data
-    action = random.choice(["classify", "regress"])
+    action = rand_choice(ACTIONS)
     prediction_details = generate_inference_info(action, 10, "predict") 
     prediction_updates = generate_inference_info(action, 10, "predict") 
 
-    (collab_id, project_id, expt_id, run_id, participant_id
-    ) = generate_federated_combination()
-
-    return (
-        pred_records, 
-        prediction_details,
-        prediction_updates,
-        (collab_id, project_id, expt_id, run_id, participant_id)
+    return EnvBundle(
+        records=pred_records,
+        details=prediction_details,
+        updates=prediction_updates,
+        ids=federated_ids,
+        hierarchy=()
     )
 
 
-@pytest.fixture(scope='session')
-def participant_env():
-    participant_records = ParticipantRecords(db_path=TEST_PATH)
+@pytest.fixture(scope='module')
+def participant_env(federated_ids):
+    participant_records = get_records(ParticipantRecords)
     reset_database(participant_records)
 
-    (collab_id, project_id, expt_id, run_id, participant_id
-    ) = generate_federated_combination()
-
     # Simulate data
+    participant_id = federated_ids.participant_id
     participant_details = {'id': participant_id, **generate_participant_info()}
     participant_updates = generate_participant_info() 
 
     # Generate downstream hierarchy
-    collaboration_records = CollaborationRecords(db_path=TEST_PATH)
-    collaboration_records.create(
-        collab_id=collab_id,
-        details=generate_collaboration_info()
-    )
-    project_records = ProjectRecords(db_path=TEST_PATH)
-    project_records.create(
-        collab_id=collab_id,
-        project_id=project_id,
-        details=generate_project_info()
+    populate_hierarchy(
+        ('collaboration', 'project'), 
+        federated_ids
     )
 
     # Generate upstream hierarchy
-    registration_records = RegistrationRecords(db_path=TEST_PATH)
-    registration_records.create(
-        collab_id=collab_id,
-        project_id=project_id,
-        participant_id=participant_id,
-        details=generate_registration_info()
-    )
-    tag_records = TagRecords(db_path=TEST_PATH)
-    tag_records.create( 
-        collab_id=collab_id, 
-        project_id=project_id,
-        participant_id=participant_id, 
-        details=generate_tag_info()
+    upstream_records = populate_hierarchy(
+        PARTICIPATION_TOPICS, 
+        federated_ids
     )
-    alignment_records = AlignmentRecords(db_path=TEST_PATH)
-    alignment_records.create( 
-        collab_id=collab_id, 
-        project_id=project_id,
-        participant_id=participant_id, 
-        details=generate_alignment_info()
-    )
-
-    def reset_env():
-        collaboration_records.delete(collab_id)
 
-    return (
-        participant_records, 
-        participant_details,
-        participant_updates,
-        (collab_id, project_id, expt_id, run_id, participant_id),
-        (registration_records, tag_records, alignment_records),
-        reset_env
+    yield EnvBundle(
+        records=participant_records,
+        details=participant_details,
+        updates=participant_updates,
+        ids=federated_ids,
+        hierarchy=upstream_records
     )
 
+    # Clear everything seeded or created within the module
+    reset_database(participant_records)
 
-@pytest.fixture(scope='session')
-def registration_env():
-    registration_records = RegistrationRecords(db_path=TEST_PATH)
+
+@pytest.fixture(scope='module')
+def registration_env(federated_ids):
+    registration_records = get_records(RegistrationRecords)
     reset_database(registration_records)
 
     # Simulate data
     registration_details = generate_registration_info()
     registration_updates = generate_registration_info() 
 
-    (collab_id, project_id, expt_id, run_id, participant_id
-    ) = generate_federated_combination()
-
     # Generate downstream hierarchy
-    collaboration_records = CollaborationRecords(db_path=TEST_PATH)
-    collaboration_records.create(
-        collab_id=collab_id,
-        details=generate_collaboration_info()
-    )
-    project_records = ProjectRecords(db_path=TEST_PATH)
-    project_records.create(
-        collab_id=collab_id,
-        project_id=project_id,
-        details=generate_project_info()
-    )
-    participant_records = ParticipantRecords(db_path=TEST_PATH)
-    participant_records.create(
-        participant_id=participant_id,
-        details={'id': participant_id, **generate_participant_info()}
+    populate_hierarchy(
+        ('collaboration', 'project', 'participant'),
+        federated_ids
     )
 
     # Generate upstream hierarchy
-    tag_records = TagRecords(db_path=TEST_PATH)
-    alignment_records = AlignmentRecords(db_path=TEST_PATH)
+    tag_records = get_records(TagRecords)
+    alignment_records = get_records(AlignmentRecords)
     
-    def reset_env():
-        collaboration_records.delete(collab_id)
-        participant_records.delete(participant_id)
-
-    return (
-        registration_records, 
-        registration_details,
-        registration_updates,
-        (collab_id, project_id, expt_id, run_id, participant_id),
-        (tag_records, alignment_records),
-        reset_env
+    yield EnvBundle(
+        records=registration_records,
+        details=registration_details,
+        updates=registration_updates,
+        ids=federated_ids,
+        hierarchy=(tag_records, alignment_records)
     )
 
+    # Clear everything seeded or created within the module
+    reset_database(registration_records)
 
-@pytest.fixture(scope='session')
-def tag_env():
-    tag_records = TagRecords(db_path=TEST_PATH)
+
+@pytest.fixture(scope='module')
+def tag_env(federated_ids):
+    tag_records = get_records(TagRecords)
     reset_database(tag_records)
 
     # Simulate data
     tag_details = generate_tag_info()
     tag_updates = generate_tag_info() 
 
-    (collab_id, project_id, expt_id, run_id, participant_id
-    ) = generate_federated_combination()
-
     # Generate downstream hierarchy
-    collaboration_records = CollaborationRecords(db_path=TEST_PATH)
-    collaboration_records.create(
-        collab_id=collab_id,
-        details=generate_collaboration_info()
-    )
-    project_records = ProjectRecords(db_path=TEST_PATH)
-    project_records.create(
-        collab_id=collab_id,
-        project_id=project_id,
-        details=generate_project_info()
-    )
-    participant_records = ParticipantRecords(db_path=TEST_PATH)
-    participant_records.create(
-        participant_id=participant_id,
-        details={'id': participant_id, **generate_participant_info()}
+    populate_hierarchy(
+        ('collaboration', 'project', 'participant'),
+        federated_ids
     )
 
     # Generate upstream hierarchy
-    registration_records = RegistrationRecords(db_path=TEST_PATH)
-    registration_records.create( 
-        collab_id=collab_id, 
-        project_id=project_id,
-        participant_id=participant_id, 
-        details=generate_registration_info()
+    (registration_records,) = populate_hierarchy(
+        ('registration',), 
+        federated_ids
     )
-    alignment_records = AlignmentRecords(db_path=TEST_PATH)
-
-    def reset_env():
-        collaboration_records.delete(collab_id)
-        participant_records.delete(participant_id)
-
-    return (
-        tag_records, 
-        tag_details,
-        tag_updates,
-        (collab_id, project_id, expt_id, run_id, participant_id),
-        (registration_records, alignment_records),
-        reset_env
+    alignment_records = get_records(AlignmentRecords)
+
+    yield EnvBundle(
+        records=tag_records,
+        details=tag_details,
+        updates=tag_updates,
+        ids=federated_ids,
+        hierarchy=(registration_records, alignment_records)
     )
 
+    # Clear everything seeded or created within the module
+    reset_database(tag_records)
+
 
-@pytest.fixture(scope='session')
-def alignment_env():
-    alignment_records = AlignmentRecords(db_path=TEST_PATH)
+@pytest.fixture(scope='module')
+def alignment_env(federated_ids):
+    alignment_records = get_records(AlignmentRecords)
     reset_database(alignment_records)
 
     # Simulate data
     alignment_details = generate_alignment_info()
     alignment_updates = generate_alignment_info() 
 
-    (collab_id, project_id, expt_id, run_id, participant_id
-    ) = generate_federated_combination()
-
     # Generate upstream hierarchy
-    registration_records = RegistrationRecords(db_path=TEST_PATH)
-    registration_records.create( 
-        collab_id=collab_id, 
-        project_id=project_id,
-        participant_id=participant_id, 
-        details=generate_registration_info()
-    )
-    tag_records = TagRecords(db_path=TEST_PATH)
-    tag_records.create(
-        collab_id=collab_id, 
-        project_id=project_id,
-        participant_id=participant_id, 
-        details=generate_tag_info()
+    populate_hierarchy(
+        ('registration', 'tag'), 
+        federated_ids
     )
 
-    def reset_env():
-        registration_records.delete(collab_id, project_id, participant_id)
-
-    return (
-        alignment_records, 
-        alignment_details,
-        alignment_updates,
-        (collab_id, project_id, expt_id, run_id, participant_id),
-        reset_env
+    yield EnvBundle(
+        records=alignment_records,
+        details=alignment_details,
+        updates=alignment_updates,
+        ids=federated_ids,
+        hierarchy=()
     )
 
+    # Clear everything seeded or created within the module
+    reset_database(alignment_records)
+
 
 if __name__ == "__main__":
     print(generate_registration_info())
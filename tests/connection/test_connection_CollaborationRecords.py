@@ -36,11 +36,9 @@ def test_CollaborationRecords_create(collab_env):
     # C4: Check that specified record was archived with correct substituent IDs
     # C5: Check that specified record captured the correct specified details
     """
-    (
-        collab_records, collab_details, _,
-        (collab_id, _, _, _, _),
-        _, 
-    ) = collab_env
+    collab_records = collab_env.records
+    collab_details = collab_env.details
+    collab_id = collab_env.ids.collab_id
     created_collab = collab_records.create(
         collab_id=collab_id,
         details=collab_details
@@ -71,19 +69,18 @@ def test_CollaborationRecords_read_all(collab_env):
     # C7: Check hierarchy-enforcing field "relations" exist
     # C8: Check that all downstream relations have been captured 
     """
-    (
-        collab_records, collab_details, _,
-        (collab_id, _, _, _, _),
-        _, 
-    ) = collab_env
+    collab_records = collab_env.records
+    collab_details = collab_env.details
+    collab_id = collab_env.ids.collab_id
     all_collabs = collab_records.read_all()
     # C1
     assert len(all_collabs) == 1
+    retrieved_ids = frozenset([collab_id])
     for retrieved_record in all_collabs:
         # C2 - C5
         check_key_equivalence(
             record=retrieved_record,
-            ids=[collab_id],
+            ids=retrieved_ids,
             r_type="collaboration"
         )
         # C6
@@ -111,11 +108,9 @@ def test_CollaborationRecords_read(collab_env):
     # C7: Check hierarchy-enforcing field "relations" exist
     # C8: Check that all downstream relations have been captured 
     """
-    (
-        collab_records, collab_details, _,
-        (collab_id, _, _, _, _),
-        _, 
-    ) = collab_env
+    collab_records = collab_env.records
+    collab_details = collab_env.details
+    collab_id = collab_env.ids.collab_id
     retrieved_collab = collab_records.read(collab_id=collab_id)
     # C1
     assert retrieved_collab is not None
@@ -149,11 +144,9 @@ def test_CollaborationRecords_update(collab_env):
     # C6: Check that collab record values have been updated
     # C7: Check hierarchy-enforcing field "relations" did not change
     """
-    (
-        collab_records, _, collab_updates,
-        (collab_id, _, _, _, _),
-        _, 
-    ) = collab_env
+    collab_records = collab_env.records
+    collab_updates = collab_env.updates
+    collab_id = collab_env.ids.collab_id
     targeted_collab = collab_records.read(collab_id=collab_id)
     updated_collab = collab_records.update(
         collab_id=collab_id,
@@ -194,13 +187,17 @@ def test_CollaborationRecords_delete(collab_env):
     # C14: Check that all tag records under current collab no longer exists
     # C15: Check that all alignment records under current collab no longer exists
     """
+    collab_records = collab_env.records
+    collab_id = collab_env.ids.collab_id
+    project_id = collab_env.ids.project_id
+    expt_id = collab_env.ids.expt_id
+    run_id = collab_env.ids.run_id
+    participant_id = collab_env.ids.participant_id
     (
-        collab_records, _, _,
-        (collab_id, project_id, expt_id, run_id, participant_id),
-        (project_records, expt_records, run_records, model_records, 
-         val_records, pred_records,
-         registration_records, tag_records, alignment_records)
-    ) = collab_env
+        project_records, expt_records, run_records, model_records,
+        val_records, pred_records, registration_records, tag_records,
+        alignment_records
+    ) = collab_env.hierarchy
     targeted_collab = collab_records.read(collab_id=collab_id)
     deleted_collab = collab_records.delete(collab_id=collab_id)
     # C1 - C4
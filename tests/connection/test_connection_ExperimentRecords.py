@@ -36,11 +36,11 @@ def test_ExperimentRecords_create(experiment_env):
     # C4: Check that specified record was archived with correct substituent IDs
     # C5: Check that specified record captured the correct specified details
     """
-    (
-        experiment_records, experiment_details, _,
-        (collab_id, project_id, expt_id, _, _),
-        _
-    ) = experiment_env
+    experiment_records = experiment_env.records
+    experiment_details = experiment_env.details
+    collab_id = experiment_env.ids.collab_id
+    project_id = experiment_env.ids.project_id
+    expt_id = experiment_env.ids.expt_id
     created_experiment = experiment_records.create(
         collab_id=collab_id,
         project_id=project_id,
@@ -73,19 +73,20 @@ def test_ExperimentRecords_read_all(experiment_env):
     # C7: Check hierarchy-enforcing field "relations" exist
     # C8: Check that all downstream relations have been captured 
     """
-    (
-        experiment_records, experiment_details, _,
-        (collab_id, project_id, expt_id, _, _),
-        _
-    ) = experiment_env
+    experiment_records = experiment_env.records
+    experiment_details = experiment_env.details
+    collab_id = experiment_env.ids.collab_id
+    project_id = experiment_env.ids.project_id
+    expt_id = experiment_env.ids.expt_id
     all_experiments = experiment_records.read_all()
     # C1
     assert len(all_experiments) == 1
+    retrieved_ids = frozenset([collab_id, project_id, expt_id])
     for retrieved_record in all_experiments:
         # C2 - C5
         check_key_equivalence(
             record=retrieved_record,
-            ids=[collab_id, project_id, expt_id],
+            ids=retrieved_ids,
             r_type="experiment"
         )
         # C6
@@ -113,11 +114,11 @@ def test_ExperimentRecords_read(experiment_env):
     # C7: Check hierarchy-enforcing field "relations" exist
     # C8: Check that all downstream relations have been captured 
     """
-    (
-        experiment_records, experiment_details, _,
-        (collab_id, project_id, expt_id, _, _),
-        _
-    ) = experiment_env
+    experiment_records = experiment_env.records
+    experiment_details = experiment_env.details
+    collab_id = experiment_env.ids.collab_id
+    project_id = experiment_env.ids.project_id
+    expt_id = experiment_env.ids.expt_id
     retrieved_experiment = experiment_records.read(
         collab_id=collab_id,
         project_id=project_id,
@@ -155,11 +156,11 @@ def test_ExperimentRecords_update(experiment_env):
     # C6: Check that experiment record values have been updated
     # C7: Check hierarchy-enforcing field "relations" did not change
     """
-    (
-        experiment_records, _, experiment_updates,
-        (collab_id, project_id, expt_id, _, _),
-        _
-    ) = experiment_env
+    experiment_records = experiment_env.records
+    experiment_updates = experiment_env.updates
+    collab_id = experiment_env.ids.collab_id
+    project_id = experiment_env.ids.project_id
+    expt_id = experiment_env.ids.expt_id
     targeted_experiment = experiment_records.read(
         collab_id=collab_id,
         project_id=project_id,
@@ -205,11 +206,15 @@ def test_ExperimentRecords_delete(experiment_env):
     # C9: Check that all validation records under current experiment no longer exists
     # C10: Check that all prediction records under current experiment no longer exists
     """
+    experiment_records = experiment_env.records
+    collab_id = experiment_env.ids.collab_id
+    project_id = experiment_env.ids.project_id
+    expt_id = experiment_env.ids.expt_id
+    run_id = experiment_env.ids.run_id
+    participant_id = experiment_env.ids.participant_id
     (
-        experiment_records, _, _,
-        (collab_id, project_id, expt_id, run_id, participant_id),
-        (run_records, model_records, val_records, pred_records)
-    ) = experiment_env
+        run_records, model_records, val_records, pred_records
+    ) = experiment_env.hierarchy
     targeted_experiment = experiment_records.read(
         collab_id=collab_id,
         project_id=project_id,
@@ -36,11 +36,9 @@ def test_ParticipantRecords_create(participant_env):
     # C4: Check that specified record was archived with correct substituent IDs
     # C5: Check that specified record captured the correct specified details
     """
-    (
-        participant_records, participant_details, _,
-        (_, _, _, _, participant_id),
-        _, _
-    ) = participant_env
+    participant_records = participant_env.records
+    participant_details = participant_env.details
+    participant_id = participant_env.ids.participant_id
     created_participant = participant_records.create(
         participant_id=participant_id,
         details=participant_details
@@ -71,19 +69,18 @@ def test_ParticipantRecords_read_all(participant_env):
     # C7: Check hierarchy-enforcing field "relations" exist
     # C8: Check that all downstream relations have been captured 
     """
-    (
-        participant_records, participant_details, _,
-        (_, _, _, _, participant_id),
-        _, _
-    ) = participant_env
+    participant_records = participant_env.records
+    participant_details = participant_env.details
+    participant_id = participant_env.ids.participant_id
     all_participants = participant_records.read_all()
     # C1
     assert len(all_participants) == 1
+    retrieved_ids = frozenset([participant_id])
     for retrieved_record in all_participants:
         # C2 - C5
         check_key_equivalence(
             record=retrieved_record,
-            ids=[participant_id],
+            ids=retrieved_ids,
             r_type="participant"
         )
         # C6
@@ -111,11 +108,9 @@ def test_ParticipantRecords_read(participant_env):
     # C7: Check hierarchy-enforcing field "relations" exist
     # C8: Check that all downstream relations have been captured 
     """
-    (
-        participant_records, participant_details, _,
-        (_, _, _, _, participant_id),
-        _, _
-    ) = participant_env
+    participant_records = participant_env.records
+    participant_details = participant_env.details
+    participant_id = participant_env.ids.participant_id
     retrieved_participant = participant_records.read(participant_id=participant_id)
     # C1
     assert retrieved_participant is not None
@@ -149,11 +144,9 @@ def test_ParticipantRecords_update(participant_env):
     # C6: Check that participant record values have been updated
     # C7: Check hierarchy-enforcing field "relations" did not change
     """
-    (
-        participant_records, _, participant_updates,
-        (_, _, _, _, participant_id),
-        _, _
-    ) = participant_env
+    participant_records = participant_env.records
+    participant_updates = participant_env.updates
+    participant_id = participant_env.ids.participant_id
     targeted_participant = participant_records.read(participant_id=participant_id)
     updated_participant = participant_records.update(
         participant_id=participant_id,
@@ -188,11 +181,13 @@ def test_ParticipantRecords_delete(participant_env):
     # C8: Check that all validation records under current participant no longer exists
     # C9: Check that all prediction records under current participant no longer exists
     """
+    participant_records = participant_env.records
+    collab_id = participant_env.ids.collab_id
+    project_id = participant_env.ids.project_id
+    participant_id = participant_env.ids.participant_id
     (
-        participant_records, _, _,
-        (collab_id, project_id, _, _, participant_id),
-        (registration_records, tag_records, alignment_records), reset_env
-    ) = participant_env
+        registration_records, tag_records, alignment_records
+    ) = participant_env.hierarchy
     targeted_participant = participant_records.read(participant_id=participant_id)
     deleted_participant = participant_records.delete(participant_id=participant_id)
     # C1 - C4
@@ -222,6 +217,4 @@ def test_ParticipantRecords_delete(participant_env):
         collab_id=collab_id,
         project_id=project_id,
         participant_id=participant_id
-    ) is None
-
-    reset_env()
\ No newline at end of file
+    ) is None
\ No newline at end of file
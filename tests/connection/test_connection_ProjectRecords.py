@@ -36,11 +36,10 @@ def test_ProjectRecords_create(project_env):
     # C4: Check that specified record was archived with correct substituent IDs
     # C5: Check that specified record captured the correct specified details
     """
-    (
-        project_records, project_details, _,
-        (collab_id, project_id, _, _, _),
-        _
-    ) = project_env
+    project_records = project_env.records
+    project_details = project_env.details
+    collab_id = project_env.ids.collab_id
+    project_id = project_env.ids.project_id
     created_project = project_records.create(
         collab_id=collab_id,
         project_id=project_id,
@@ -72,19 +71,19 @@ def test_ProjectRecords_read_all(project_env):
     # C7: Check hierarchy-enforcing field "relations" exist
     # C8: Check that all downstream relations have been captured 
     """
-    (
-        project_records, project_details, _,
-        (collab_id, project_id, _, _, _),
-        _
-    ) = project_env
+    project_records = project_env.records
+    project_details = project_env.details
+    collab_id = project_env.ids.collab_id
+    project_id = project_env.ids.project_id
     all_projects = project_records.read_all()
     # C1
     assert len(all_projects) == 1
+    retrieved_ids = frozenset([collab_id, project_id])
     for retrieved_record in all_projects:
         # C2 - C5
         check_key_equivalence(
             record=retrieved_record,
-            ids=[collab_id, project_id],
+            ids=retrieved_ids,
             r_type="project"
         )
         # C6
@@ -112,11 +111,10 @@ def test_ProjectRecords_read(project_env):
     # C7: Check hierarchy-enforcing field "relations" exist
     # C8: Check that all downstream relations have been captured 
     """
-    (
-        project_records, project_details, _,
-        (collab_id, project_id, _, _, _),
-        _
-    ) = project_env
+    project_records = project_env.records
+    project_details = project_env.details
+    collab_id = project_env.ids.collab_id
+    project_id = project_env.ids.project_id
     retrieved_project = project_records.read(
         collab_id=collab_id,
         project_id=project_id
@@ -153,11 +151,10 @@ def test_ProjectRecords_update(project_env):
     # C6: Check that project record values have been updated
     # C7: Check hierarchy-enforcing field "relations" did not change
     """
-    (
-        project_records, _, project_updates,
-        (collab_id, project_id, _, _, _),
-        _
-    ) = project_env
+    project_records = project_env.records
+    project_updates = project_env.updates
+    collab_id = project_env.ids.collab_id
+    project_id = project_env.ids.project_id
     targeted_project = project_records.read(
         collab_id=collab_id,
         project_id=project_id
@@ -201,11 +198,15 @@ def test_ProjectRecords_delete(project_env):
     # C10: Check that all validation records under current project no longer exists
     # C11: Check that all prediction records under current project no longer exists
     """
+    project_records = project_env.records
+    collab_id = project_env.ids.collab_id
+    project_id = project_env.ids.project_id
+    expt_id = project_env.ids.expt_id
+    run_id = project_env.ids.run_id
+    participant_id = project_env.ids.participant_id
     (
-        project_records, _, _,
-        (collab_id, project_id, expt_id, run_id, participant_id),
-        (expt_records, run_records, model_records, val_records, pred_records)
-    ) = project_env
+        expt_records, run_records, model_records, val_records, pred_records
+    ) = project_env.hierarchy
     targeted_project = project_records.read(
         collab_id=collab_id,
         project_id=project_id
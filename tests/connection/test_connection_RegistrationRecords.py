@@ -4,9 +4,6 @@
 # Required Modules #
 ####################
 
-# Generic/Built-in
-import copy
-
 # Libs
 import tinydb
 
@@ -15,15 +12,19 @@ from conftest import (
     generate_tag_info,
     generate_alignment_info,
     check_key_equivalence,
-    check_relation_equivalence,
     check_link_equivalence,
-    check_detail_equivalence
+    check_detail_equivalence,
+    check_record_equivalence
 )
 
 ##################
 # Configurations #
 ##################
 
+# Downstream details imported into a registration by .read() & .read_all()
+IMPORTED_FIELDS = frozenset(['collaboration', 'project', 'participant'])
+
+
 def check_registration_detail_equivalence(
     record: tinydb.database.Document, 
     details: dict
@@ -38,20 +39,19 @@ def check_registration_detail_equivalence(
     # C3: Check that participant details have been correctly imported
     # C4: Check that specified record captured the correct specified details
     """
-    # Ensure that a cloned record is no different from its original
-    cloned_record = copy.deepcopy(record)
-    assert cloned_record == record
     # C1
-    involved_collaboration = cloned_record.pop('collaboration')
-    assert involved_collaboration is not None
+    assert record['collaboration'] is not None
     # C2
-    involved_project = cloned_record.pop('project')
-    assert involved_project is not None
+    assert record['project'] is not None
     # C3
-    involved_participant = cloned_record.pop('participant')
-    assert involved_participant is not None
+    assert record['participant'] is not None
     # C4
-    check_detail_equivalence(record=cloned_record, details=details)
+    registered_record = {
+        field: value 
+        for field, value in record.items() 
+        if field not in IMPORTED_FIELDS
+    }
+    check_detail_equivalence(record=registered_record, details=details)
 
 ###################################
 # RegistrationRecords Class Tests #
@@ -69,11 +69,11 @@ def test_RegistrationRecords_create(registration_env):
     # C6: Check that keys in "link" are disjointed sets w.r.t "key"
     # C7: Check that specified record captured the correct specified details
     """
-    (
-        registration_records, registration_details, _,
-        (collab_id, project_id, _, _, participant_id),
-        _, _
-    ) = registration_env
+    registration_records = registration_env.records
+    registration_details = registration_env.details
+    collab_id = registration_env.ids.collab_id
+    project_id = registration_env.ids.project_id
+    participant_id = registration_env.ids.participant_id
     created_registration = registration_records.create(
         collab_id=collab_id,
         project_id=project_id,
@@ -118,11 +118,12 @@ def test_RegistrationRecords_read_all(registration_env):
     # C14: Check that tags captured have the correct details
     # C15: Check that alignments captured have the correct details
     """
-    (
-        registration_records, registration_details, _,
-        (collab_id, project_id, _, _, participant_id),
-        (tag_records, alignment_records), _
-    ) = registration_env
+    registration_records = registration_env.records
+    registration_details = registration_env.details
+    collab_id = registration_env.ids.collab_id
+    project_id = registration_env.ids.project_id
+    participant_id = registration_env.ids.participant_id
+    tag_records, alignment_records = registration_env.hierarchy
 
     # Build remaining upstream hierarchy dynamically 
     # (IMPT! Relations are only detected if records are created in sequence!)
@@ -142,16 +143,12 @@ def test_RegistrationRecords_read_all(registration_env):
     all_registrations = registration_records.read_all()
     # C1
     assert len(all_registrations) == 1
+    retrieved_ids = frozenset([participant_id, collab_id, project_id])
     for retrieved_record in all_registrations:
-        # C2 - C5
-        check_key_equivalence(
-            record=retrieved_record,
-            ids=[participant_id, collab_id, project_id],
-            r_type="registration"
-        )
-        # C6 - C7
-        check_link_equivalence(
+        # C2 - C5, C6 - C7, C12 - C13
+        check_record_equivalence(
             record=retrieved_record,
+            ids=retrieved_ids,
             r_type="registration"
         )
         # C8 -  C11
@@ -159,11 +156,6 @@ def test_RegistrationRecords_read_all(registration_env):
             record=retrieved_record,
             details=registration_details
         )
-        # C12 - C13
-        check_relation_equivalence(
-            record=retrieved_record,
-            r_type="registration"
-        )
         # C14
         related_tag = retrieved_record['relations']['Tag'][0]
         assert related_tag == created_tag
@@ -204,11 +196,12 @@ def test_RegistrationRecords_read(registration_env):
     # C14: Check hierarchy-enforcing field "relations" exist
     # C15: Check that all downstream relations have been captured 
     """
-    (
-        registration_records, registration_details, _,
-        (collab_id, project_id, _, _, participant_id),
-        (tag_records, alignment_records), _
-    ) = registration_env
+    registration_records = registration_env.records
+    registration_details = registration_env.details
+    collab_id = registration_env.ids.collab_id
+    project_id = registration_env.ids.project_id
+    participant_id = registration_env.ids.participant_id
+    tag_records, alignment_records = registration_env.hierarchy
 
     # Build remaining upstream hierarchy dynamically 
     # (IMPT! Relations are only detected if records are created in sequence!)
@@ -233,27 +226,17 @@ def test_RegistrationRecords_read(registration_env):
 
     # C1
     assert retrieved_registration is not None
-    # C2 - C5
-    check_key_equivalence(
+    # C2 - C5, C6 - C7, C12 - C13
+    check_record_equivalence(
         record=retrieved_registration,
         ids=[participant_id, collab_id, project_id],
         r_type="registration"
     )
-    # C6 - C7
-    check_link_equivalence(
-        record=retrieved_registration,
-        r_type="registration"
-    )
     # C8 - C11
     check_registration_detail_equivalence(
         record=retrieved_registration,
         details=registration_details
     )
-    # C12 - C13
-    check_relation_equivalence(
-        record=retrieved_registration,
-        r_type="registration"
-    )
     # C14
     related_tag = retrieved_registration['relations']['Tag'][0]
     assert related_tag == created_tag
@@ -288,11 +271,11 @@ def test_RegistrationRecords_update(registration_env):
     # C8: Check that registration record values have been updated
     # C9: Check hierarchy-enforcing field "relations" did not change
     """
-    (
-        registration_records, _, registration_updates,
-        (collab_id, project_id, _, _, participant_id),
-        _, _
-    ) = registration_env
+    registration_records = registration_env.records
+    registration_updates = registration_env.updates
+    collab_id = registration_env.ids.collab_id
+    project_id = registration_env.ids.project_id
+    participant_id = registration_env.ids.participant_id
     targeted_registration = registration_records.read(
         collab_id=collab_id,
         project_id=project_id,
@@ -343,11 +326,11 @@ def test_RegistrationRecords_delete(registration_env):
     # C9: Check that all tag records under current project no longer exists
     # C10: Check that all alignment records under current project no longer exists
     """
-    (
-        registration_records, _, _,
-        (collab_id, project_id, _, _, participant_id),
-        (tag_records, alignment_records), reset_env
-    ) = registration_env
+    registration_records = registration_env.records
+    collab_id = registration_env.ids.collab_id
+    project_id = registration_env.ids.project_id
+    participant_id = registration_env.ids.participant_id
+    tag_records, alignment_records = registration_env.hierarchy
 
     # Build remaining upstream hierarchy dynamically 
     # (IMPT! Relations are only detected if records are created in sequence!)
@@ -404,6 +387,4 @@ def test_RegistrationRecords_delete(registration_env):
         participant_id=participant_id,
         collab_id=collab_id,
         project_id=project_id
-    ) is None
-
-    reset_env()
\ No newline at end of file
+    ) is None
\ No newline at end of file
@@ -36,11 +36,12 @@ def test_RunRecords_create(run_env):
     # C4: Check that specified record was archived with correct substituent IDsy"
     # C5: Check that specified record captured the correct specified details
     """
-    (
-        run_records, run_details, _,
-        (collab_id, project_id, expt_id, run_id, _),
-        _
-    ) = run_env
+    run_records = run_env.records
+    run_details = run_env.details
+    collab_id = run_env.ids.collab_id
+    project_id = run_env.ids.project_id
+    expt_id = run_env.ids.expt_id
+    run_id = run_env.ids.run_id
     created_run = run_records.create(
         collab_id=collab_id,
         project_id=project_id,
@@ -74,19 +75,21 @@ def test_RunRecords_read_all(run_env):
     # C7: Check hierarchy-enforcing field "relations" exist
     # C8: Check that all downstream relations have been captured 
     """
-    (
-        run_records, run_details, _,
-        (collab_id, project_id, expt_id, run_id, _),
-        _
-    ) = run_env
+    run_records = run_env.records
+    run_details = run_env.details
+    collab_id = run_env.ids.collab_id
+    project_id = run_env.ids.project_id
+    expt_id = run_env.ids.expt_id
+    run_id = run_env.ids.run_id
     all_runs = run_records.read_all()
     # C1
     assert len(all_runs) == 1
+    retrieved_ids = frozenset([collab_id, project_id, expt_id, run_id])
     for retrieved_record in all_runs:
         # C2 - C5
         check_key_equivalence(
             record=retrieved_record,
-            ids=[collab_id, project_id, expt_id, run_id],
+            ids=retrieved_ids,
             r_type="run"
         )
         # C6
@@ -114,11 +117,12 @@ def test_RunRecords_read(run_env):
     # C7: Check hierarchy-enforcing field "relations" exist
     # C8: Check that all downstream relations have been captured 
     """
-    (
-        run_records, run_details, _,
-        (collab_id, project_id, expt_id, run_id, _),
-        _
-    ) = run_env
+    run_records = run_env.records
+    run_details = run_env.details
+    collab_id = run_env.ids.collab_id
+    project_id = run_env.ids.project_id
+    expt_id = run_env.ids.expt_id
+    run_id = run_env.ids.run_id
     retrieved_run = run_records.read(
         collab_id=collab_id,
         project_id=project_id,
@@ -157,11 +161,12 @@ def test_RunRecords_update(run_env):
     # C6: Check that run record values have been updated
     # C7: Check hierarchy-enforcing field "relations" did not change
     """
-    (
-        run_records, _, run_updates,
-        (collab_id, project_id, expt_id, run_id, _),
-        _
-    ) = run_env
+    run_records = run_env.records
+    run_updates = run_env.updates
+    collab_id = run_env.ids.collab_id
+    project_id = run_env.ids.project_id
+    expt_id = run_env.ids.expt_id
+    run_id = run_env.ids.run_id
     targeted_run = run_records.read(
         collab_id=collab_id,
         project_id=project_id,
@@ -209,11 +214,13 @@ def test_RunRecords_delete(run_env):
     # C8: Check that all validation records under current run no longer exists
     # C9: Check that all prediction records under current run no longer exists
     """
-    (
-        run_records, _, _,
-        (collab_id, project_id, expt_id, run_id, participant_id),
-        (model_records, val_records, pred_records)
-    ) = run_env
+    run_records = run_env.records
+    collab_id = run_env.ids.collab_id
+    project_id = run_env.ids.project_id
+    expt_id = run_env.ids.expt_id
+    run_id = run_env.ids.run_id
+    participant_id = run_env.ids.participant_id
+    model_records, val_records, pred_records = run_env.hierarchy
     targeted_run = run_records.read(
         collab_id=collab_id,
         project_id=project_id,
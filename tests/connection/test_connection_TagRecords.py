@@ -14,9 +14,9 @@
 from conftest import (
     generate_alignment_info,
     check_key_equivalence,
-    check_relation_equivalence,
     check_link_equivalence,
-    check_detail_equivalence
+    check_detail_equivalence,
+    check_record_equivalence
 )
 
 
@@ -41,11 +41,11 @@ def test_TagRecords_create(tag_env):
     # C6: Check that keys in "link" are disjointed sets w.r.t "key"
     # C7: Check that specified record captured the correct specified details
     """
-    (
-        tag_records, tag_details, _,
-        (collab_id, project_id, _, _, participant_id),
-        _, _
-    ) = tag_env
+    tag_records = tag_env.records
+    tag_details = tag_env.details
+    collab_id = tag_env.ids.collab_id
+    project_id = tag_env.ids.project_id
+    participant_id = tag_env.ids.participant_id
     created_tag = tag_records.create(
         collab_id=collab_id,
         project_id=project_id,
@@ -86,11 +86,12 @@ def test_TagRecords_read_all(tag_env):
     # C10: Check that all downstream relations have been captured 
     # C11: Check that alignments captured have the correct details
     """
-    (
-        tag_records, tag_details, _,
-        (collab_id, project_id, _, _, participant_id),
-        (_, alignment_records), _
-    ) = tag_env
+    tag_records = tag_env.records
+    tag_details = tag_env.details
+    collab_id = tag_env.ids.collab_id
+    project_id = tag_env.ids.project_id
+    participant_id = tag_env.ids.participant_id
+    _, alignment_records = tag_env.hierarchy
 
     # Build downstream hierarchy 
     # (IMPT! Relations are only detected if records are created in sequence!)
@@ -104,16 +105,12 @@ def test_TagRecords_read_all(tag_env):
     all_tags = tag_records.read_all()
     # C1
     assert len(all_tags) == 1
+    retrieved_ids = frozenset([participant_id, collab_id, project_id])
     for retrieved_record in all_tags:
-        # C2 - C5
-        check_key_equivalence(
-            record=retrieved_record,
-            ids=[participant_id, collab_id, project_id],
-            r_type="tag"
-        )
-        # C6 - C7
-        check_link_equivalence(
+        # C2 - C5, C6 - C7, C9 - C10
+        check_record_equivalence(
             record=retrieved_record,
+            ids=retrieved_ids,
             r_type="tag"
         )
         # C8
@@ -121,11 +118,6 @@ def test_TagRecords_read_all(tag_env):
             record=retrieved_record,
             details=tag_details
         )
-        # C9 - C10
-        check_relation_equivalence(
-            record=retrieved_record,
-            r_type="tag"
-        )
 
         # C11
         related_alignment = retrieved_record['relations']['Alignment'][0]
@@ -155,11 +147,12 @@ def test_TagRecords_read(tag_env):
     # C10: Check that all downstream relations have been captured 
     # C11: Check that alignments captured have the correct details
     """
-    (
-        tag_records, tag_details, _,
-        (collab_id, project_id, _, _, participant_id),
-        (_, alignment_records), _
-    ) = tag_env
+    tag_records = tag_env.records
+    tag_details = tag_env.details
+    collab_id = tag_env.ids.collab_id
+    project_id = tag_env.ids.project_id
+    participant_id = tag_env.ids.participant_id
+    _, alignment_records = tag_env.hierarchy
 
     # Build downstream hierarchy 
     # (IMPT! Relations are only detected if records are created in sequence!)
@@ -178,27 +171,17 @@ def test_TagRecords_read(tag_env):
 
     # C1
     assert retrieved_tag is not None
-    # C2 - C5
-    check_key_equivalence(
+    # C2 - C5, C6 - C7, C9 - C10
+    check_record_equivalence(
         record=retrieved_tag,
         ids=[participant_id, collab_id, project_id],
         r_type="tag"
     )
-    # C6 - C7
-    check_link_equivalence(
-        record=retrieved_tag,
-        r_type="tag"
-    )
     # C8
     check_detail_equivalence(
         record=retrieved_tag,
         details=tag_details
     )
-    # C9 - C10
-    check_relation_equivalence(
-        record=retrieved_tag,
-        r_type="tag"
-    )
 
     # C11
     related_alignment = retrieved_tag['relations']['Alignment'][0]
@@ -226,11 +209,11 @@ def test_TagRecords_update(tag_env):
     # C8: Check that tag record values have been updated
     # C9: Check hierarchy-enforcing field "relations" did not change
     """
-    (
-        tag_records, _, tag_updates,
-        (collab_id, project_id, _, _, participant_id),
-        _, _
-    ) = tag_env
+    tag_records = tag_env.records
+    tag_updates = tag_env.updates
+    collab_id = tag_env.ids.collab_id
+    project_id = tag_env.ids.project_id
+    participant_id = tag_env.ids.participant_id
     targeted_tag = tag_records.read(
         collab_id=collab_id,
         project_id=project_id,
@@ -280,11 +263,11 @@ def test_TagRecords_delete(tag_env):
     # C8: Check that specified tag record no longer exists
     # C9: Check that all alignment records under current project no longer exists
     """
-    (
-        tag_records, _, _,
-        (collab_id, project_id, _, _, participant_id),
-        (_, alignment_records), reset_env
-    ) = tag_env
+    tag_records = tag_env.records
+    collab_id = tag_env.ids.collab_id
+    project_id = tag_env.ids.project_id
+    participant_id = tag_env.ids.participant_id
+    _, alignment_records = tag_env.hierarchy
 
     # Build remaining upstream hierarchy dynamically 
     # (IMPT! Relations are only detected if records are created in sequence!)
@@ -329,6 +312,4 @@ def test_TagRecords_delete(tag_env):
         collab_id=collab_id,
         project_id=project_id,
         participant_id=participant_id,
-    ) is None
-
-    reset_env()
\ No newline at end of file
+    ) is None
\ No newline at end of file
@@ -37,12 +37,12 @@ def test_MLFRecords_create(mlf_env):
     # C4: Check that specified record was archived with correct substituent IDs
     # C5: Check that specified record captured the correct specified details
     """
-    (
-        mlf_records, 
-        all_mlf_details, 
-        _,
-        (collab_id, project_id, expt_id, run_id, _)
-    ) = mlf_env
+    mlf_records = mlf_env.records
+    all_mlf_details = mlf_env.details
+    collab_id = mlf_env.ids.collab_id
+    project_id = mlf_env.ids.project_id
+    expt_id = mlf_env.ids.expt_id
+    run_id = mlf_env.ids.run_id
 
     relevant_ids = [expt_id, run_id]
     for mlf_details, record_id in zip(all_mlf_details, relevant_ids):
@@ -78,12 +78,12 @@ def test_MLFRecords_read_all(mlf_env):
     # C7: Check hierarchy-enforcing field "relations" exist
     # C8: Check that all downstream relations have been captured 
     """
-    (
-        mlf_records,
-        (mlf_expt_details, mlf_run_details), 
-        _,
-        (collab_id, project_id, expt_id, run_id, _)
-    ) = mlf_env
+    mlf_records = mlf_env.records
+    mlf_expt_details, mlf_run_details = mlf_env.details
+    collab_id = mlf_env.ids.collab_id
+    project_id = mlf_env.ids.project_id
+    expt_id = mlf_env.ids.expt_id
+    run_id = mlf_env.ids.run_id
     all_mlfs = mlf_records.read_all()
     # C1
     assert len(all_mlfs) == 2
@@ -128,12 +128,12 @@ def test_MLFRecords_read(mlf_env):
     # C7: Check hierarchy-enforcing field "relations" exist
     # C8: Check that all downstream relations have been captured 
     """
-    (
-        mlf_records, 
-        all_mlf_details, 
-        _,
-        (collab_id, project_id, expt_id, run_id, _)
-    ) = mlf_env
+    mlf_records = mlf_env.records
+    all_mlf_details = mlf_env.details
+    collab_id = mlf_env.ids.collab_id
+    project_id = mlf_env.ids.project_id
+    expt_id = mlf_env.ids.expt_id
+    run_id = mlf_env.ids.run_id
 
     relevant_ids = [expt_id, run_id]
     for mlf_details, record_id in zip(all_mlf_details, relevant_ids):
@@ -174,12 +174,12 @@ def test_MLFRecords_update(mlf_env):
     # C6: Check that mlf record values have been updated
     # C7: Check hierarchy-enforcing field "relations" did not change
     """
-    (
-        mlf_records, 
-        _, 
-        all_mlf_updates,
-        (collab_id, project_id, expt_id, run_id, _)
-    ) = mlf_env
+    mlf_records = mlf_env.records
+    all_mlf_updates = mlf_env.updates
+    collab_id = mlf_env.ids.collab_id
+    project_id = mlf_env.ids.project_id
+    expt_id = mlf_env.ids.expt_id
+    run_id = mlf_env.ids.run_id
 
     relevant_ids = [expt_id, run_id]
     for mlf_updates, record_id in zip(all_mlf_updates, relevant_ids):
@@ -224,10 +224,11 @@ def test_MLFRecords_delete(mlf_env):
     # C5: Check that the original mlf record was deleted (not a copy)
     # C6: Check that specified mlf record no longer exists
     """
-    (
-        mlf_records, _, _,
-        (collab_id, project_id, expt_id, run_id, _)
-    ) = mlf_env
+    mlf_records = mlf_env.records
+    collab_id = mlf_env.ids.collab_id
+    project_id = mlf_env.ids.project_id
+    expt_id = mlf_env.ids.expt_id
+    run_id = mlf_env.ids.run_id
 
     for record_id in (expt_id, run_id):
         targeted_mlf = mlf_records.read(
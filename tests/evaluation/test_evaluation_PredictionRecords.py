@@ -13,9 +13,9 @@
 # Custom
 from conftest import (
     check_key_equivalence,
-    check_relation_equivalence,
     check_link_equivalence,
-    check_detail_equivalence
+    check_detail_equivalence,
+    check_record_equivalence
 )
 
 
@@ -40,10 +40,13 @@ def test_PredictionRecords_create(prediction_env):
     # C6: Check that keys in "link" are disjointed sets w.r.t "key"
     # C7: Check that specified record captured the correct specified details
     """
-    (
-        prediction_records, prediction_details, _,
-        (collab_id, project_id, expt_id, run_id, participant_id)
-    ) = prediction_env
+    prediction_records = prediction_env.records
+    prediction_details = prediction_env.details
+    collab_id = prediction_env.ids.collab_id
+    project_id = prediction_env.ids.project_id
+    expt_id = prediction_env.ids.expt_id
+    run_id = prediction_env.ids.run_id
+    participant_id = prediction_env.ids.participant_id
     created_prediction = prediction_records.create(
         participant_id=participant_id,
         collab_id=collab_id,
@@ -85,23 +88,24 @@ def test_PredictionRecords_read_all(prediction_env):
     # C9: Check hierarchy-enforcing field "relations" exist
     # C10: Check that all downstream relations have been captured 
     """
-    (
-        prediction_records, prediction_details, _,
-        (collab_id, project_id, expt_id, run_id, participant_id)
-    ) = prediction_env
+    prediction_records = prediction_env.records
+    prediction_details = prediction_env.details
+    collab_id = prediction_env.ids.collab_id
+    project_id = prediction_env.ids.project_id
+    expt_id = prediction_env.ids.expt_id
+    run_id = prediction_env.ids.run_id
+    participant_id = prediction_env.ids.participant_id
     all_predictions = prediction_records.read_all()
     # C1
     assert len(all_predictions) == 1
+    retrieved_ids = frozenset([
+        participant_id, collab_id, project_id, expt_id, run_id
+    ])
     for retrieved_record in all_predictions:
-        # C2 - C5
-        check_key_equivalence(
-            record=retrieved_record,
-            ids=[participant_id, collab_id, project_id, expt_id, run_id],
-            r_type="prediction"
-        )
-        # C6 - C7
-        check_link_equivalence(
+        # C2 - C5, C6 - C7, C9 - C10
+        check_record_equivalence(
             record=retrieved_record,
+            ids=retrieved_ids,
             r_type="prediction"
         )
         # C8
@@ -109,11 +113,6 @@ def test_PredictionRecords_read_all(prediction_env):
             record=retrieved_record,
             details=prediction_details
         )
-        # C9 - C10
-        check_relation_equivalence(
-            record=retrieved_record,
-            r_type="prediction"
-        )
 
 
 def test_PredictionRecords_read(prediction_env):
@@ -131,10 +130,13 @@ def test_PredictionRecords_read(prediction_env):
     # C9: Check hierarchy-enforcing field "relations" exist
     # C10: Check that all downstream relations have been captured 
     """
-    (
-        prediction_records, prediction_details, _,
-        (collab_id, project_id, expt_id, run_id, participant_id)
-    ) = prediction_env
+    prediction_records = prediction_env.records
+    prediction_details = prediction_env.details
+    collab_id = prediction_env.ids.collab_id
+    project_id = prediction_env.ids.project_id
+    expt_id = prediction_env.ids.expt_id
+    run_id = prediction_env.ids.run_id
+    participant_id = prediction_env.ids.participant_id
     retrieved_prediction = prediction_records.read(
         participant_id=participant_id,
         collab_id=collab_id,
@@ -144,27 +146,17 @@ def test_PredictionRecords_read(prediction_env):
     )
     # C1
     assert retrieved_prediction is not None
-    # C2 - C5
-    check_key_equivalence(
+    # C2 - C5, C6 - C7, C9 - C10
+    check_record_equivalence(
         record=retrieved_prediction,
         ids=[participant_id, collab_id, project_id, expt_id, run_id],
         r_type="prediction"
     )
-    # C6 - C7
-    check_link_equivalence(
-        record=retrieved_prediction,
-        r_type="prediction"
-    )
     # C8
     check_detail_equivalence(
         record=retrieved_prediction,
         details=prediction_details
     )
-    # C9 - C10
-    check_relation_equivalence(
-        record=retrieved_prediction,
-        r_type="prediction"
-    )
 
 
 def test_PredictionRecords_update(prediction_env):
@@ -181,10 +173,13 @@ def test_PredictionRecords_update(prediction_env):
     # C8: Check that prediction record values have been updated
     # C9: Check hierarchy-enforcing field "relations" did not change
     """
-    (
-        prediction_records, _, prediction_updates,
-        (collab_id, project_id, expt_id, run_id, participant_id)
-    ) = prediction_env
+    prediction_records = prediction_env.records
+    prediction_updates = prediction_env.updates
+    collab_id = prediction_env.ids.collab_id
+    project_id = prediction_env.ids.project_id
+    expt_id = prediction_env.ids.expt_id
+    run_id = prediction_env.ids.run_id
+    participant_id = prediction_env.ids.participant_id
     targeted_prediction = prediction_records.read(
         participant_id=participant_id,
         collab_id=collab_id,
@@ -239,10 +234,12 @@ def test_PredictionRecords_delete(prediction_env):
     # C7: Check that the original prediction record was deleted (not a copy)
     # C8: Check that specified prediction record no longer exists
     """
-    (
-        prediction_records, _, _,
-        (collab_id, project_id, expt_id, run_id, participant_id)
-    ) = prediction_env
+    prediction_records = prediction_env.records
+    collab_id = prediction_env.ids.collab_id
+    project_id = prediction_env.ids.project_id
+    expt_id = prediction_env.ids.expt_id
+    run_id = prediction_env.ids.run_id
+    participant_id = prediction_env.ids.participant_id
     targeted_prediction = prediction_records.read(
         participant_id=participant_id,
         collab_id=collab_id,
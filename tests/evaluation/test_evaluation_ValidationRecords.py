@@ -13,9 +13,9 @@
 # Custom
 from conftest import (
     check_key_equivalence,
-    check_relation_equivalence,
     check_link_equivalence,
-    check_detail_equivalence
+    check_detail_equivalence,
+    check_record_equivalence
 )
 
 
@@ -40,10 +40,13 @@ def test_ValidationRecords_create(validation_env):
     # C6: Check that keys in "link" are disjointed sets w.r.t "key"
     # C7: Check that specified record captured the correct specified details
     """
-    (
-        validation_records, validation_details, _,
-        (collab_id, project_id, expt_id, run_id, participant_id)
-    ) = validation_env
+    validation_records = validation_env.records
+    validation_details = validation_env.details
+    collab_id = validation_env.ids.collab_id
+    project_id = validation_env.ids.project_id
+    expt_id = validation_env.ids.expt_id
+    run_id = validation_env.ids.run_id
+    participant_id = validation_env.ids.participant_id
     created_validation = validation_records.create(
         participant_id=participant_id,
         collab_id=collab_id,
@@ -85,23 +88,24 @@ def test_ValidationRecords_read_all(validation_env):
     # C9: Check hierarchy-enforcing field "relations" exist
     # C10: Check that all downstream relations have been captured 
     """
-    (
-        validation_records, validation_details, _,
-        (collab_id, project_id, expt_id, run_id, participant_id)
-    ) = validation_env
+    validation_records = validation_env.records
+    validation_details = validation_env.details
+    collab_id = validation_env.ids.collab_id
+    project_id = validation_env.ids.project_id
+    expt_id = validation_env.ids.expt_id
+    run_id = validation_env.ids.run_id
+    participant_id = validation_env.ids.participant_id
     all_validations = validation_records.read_all()
     # C1
     assert len(all_validations) == 1
+    retrieved_ids = frozenset([
+        participant_id, collab_id, project_id, expt_id, run_id
+    ])
     for retrieved_record in all_validations:
-        # C2 - C5
-        check_key_equivalence(
-            record=retrieved_record,
-            ids=[participant_id, collab_id, project_id, expt_id, run_id],
-            r_type="validation"
-        )
-        # C6 - C7
-        check_link_equivalence(
+        # C2 - C5, C6 - C7, C9 - C10
+        check_record_equivalence(
             record=retrieved_record,
+            ids=retrieved_ids,
             r_type="validation"
         )
         # C8
@@ -109,11 +113,6 @@ def test_ValidationRecords_read_all(validation_env):
             record=retrieved_record,
             details=validation_details
         )
-        # C9 - C10
-        check_relation_equivalence(
-            record=retrieved_record,
-            r_type="validation"
-        )
 
 
 def test_ValidationRecords_read(validation_env):
@@ -131,10 +130,13 @@ def test_ValidationRecords_read(validation_env):
     # C9: Check hierarchy-enforcing field "relations" exist
     # C10: Check that all downstream relations have been captured 
     """
-    (
-        validation_records, validation_details, _,
-        (collab_id, project_id, expt_id, run_id, participant_id)
-    ) = validation_env
+    validation_records = validation_env.records
+    validation_details = validation_env.details
+    collab_id = validation_env.ids.collab_id
+    project_id = validation_env.ids.project_id
+    expt_id = validation_env.ids.expt_id
+    run_id = validation_env.ids.run_id
+    participant_id = validation_env.ids.participant_id
     retrieved_validation = validation_records.read(
         participant_id=participant_id,
         collab_id=collab_id,
@@ -144,27 +146,17 @@ def test_ValidationRecords_read(validation_env):
     )
     # C1
     assert retrieved_validation is not None
-    # C2 - C5
-    check_key_equivalence(
+    # C2 - C5, C6 - C7, C9 - C10
+    check_record_equivalence(
         record=retrieved_validation,
         ids=[participant_id, collab_id, project_id, expt_id, run_id],
         r_type="validation"
     )
-    # C6 - C7
-    check_link_equivalence(
-        record=retrieved_validation,
-        r_type="validation"
-    )
     # C8
     check_detail_equivalence(
         record=retrieved_validation,
         details=validation_details
     )
-    # C9 - C10
-    check_relation_equivalence(
-        record=retrieved_validation,
-        r_type="validation"
-    )
 
 
 def test_ValidationRecords_update(validation_env):
@@ -181,10 +173,13 @@ def test_ValidationRecords_update(validation_env):
     # C8: Check that validation record values have been updated
     # C9: Check hierarchy-enforcing field "relations" did not change
     """
-    (
-        validation_records, _, validation_updates,
-        (collab_id, project_id, expt_id, run_id, participant_id)
-    ) = validation_env
+    validation_records = validation_env.records
+    validation_updates = validation_env.updates
+    collab_id = validation_env.ids.collab_id
+    project_id = validation_env.ids.project_id
+    expt_id = validation_env.ids.expt_id
+    run_id = validation_env.ids.run_id
+    participant_id = validation_env.ids.participant_id
     targeted_validation = validation_records.read(
         participant_id=participant_id,
         collab_id=collab_id,
@@ -239,10 +234,12 @@ def test_ValidationRecords_delete(validation_env):
     # C7: Check that the original validation record was deleted (not a copy)
     # C8: Check that specified validation record no longer exists
     """
-    (
-        validation_records, _, _,
-        (collab_id, project_id, expt_id, run_id, participant_id)
-    ) = validation_env
+    validation_records = validation_env.records
+    collab_id = validation_env.ids.collab_id
+    project_id = validation_env.ids.project_id
+    expt_id = validation_env.ids.expt_id
+    run_id = validation_env.ids.run_id
+    participant_id = validation_env.ids.participant_id
     targeted_validation = validation_records.read(
         participant_id=participant_id,
         collab_id=collab_id,
@@ -13,9 +13,9 @@
 # Custom
 from conftest import (
     check_key_equivalence,
-    check_relation_equivalence,
     check_link_equivalence,
-    check_detail_equivalence
+    check_detail_equivalence,
+    check_record_equivalence
 )
 
 
@@ -40,10 +40,11 @@ def test_AlignmentRecords_create(alignment_env):
     # C6: Check that keys in "link" are disjointed sets w.r.t "key"
     # C7: Check that specified record captured the correct specified details
     """
-    (
-        alignment_records, alignment_details, _,
-        (collab_id, project_id, _, _, participant_id), _
-    ) = alignment_env
+    alignment_records = alignment_env.records
+    alignment_details = alignment_env.details
+    collab_id = alignment_env.ids.collab_id
+    project_id = alignment_env.ids.project_id
+    participant_id = alignment_env.ids.participant_id
     created_alignment = alignment_records.create(
         collab_id=collab_id,
         project_id=project_id,
@@ -83,23 +84,20 @@ def test_AlignmentRecords_read_all(alignment_env):
     # C9: Check hierarchy-enforcing field "relations" exist
     # C10: Check that all downstream relations have been captured 
     """
-    (
-        alignment_records, alignment_details, _,
-        (collab_id, project_id, _, _, participant_id), _
-    ) = alignment_env
+    alignment_records = alignment_env.records
+    alignment_details = alignment_env.details
+    collab_id = alignment_env.ids.collab_id
+    project_id = alignment_env.ids.project_id
+    participant_id = alignment_env.ids.participant_id
     all_alignments = alignment_records.read_all()
     # C1
     assert len(all_alignments) == 1
+    retrieved_ids = frozenset([participant_id, collab_id, project_id])
     for retrieved_record in all_alignments:
-        # C2 - C5
-        check_key_equivalence(
-            record=retrieved_record,
-            ids=[participant_id, collab_id, project_id],
-            r_type="alignment"
-        )
-        # C6 - C7
-        check_link_equivalence(
+        # C2 - C5, C6 - C7, C9 - C10
+        check_record_equivalence(
             record=retrieved_record,
+            ids=retrieved_ids,
             r_type="alignment"
         )
         # C8
@@ -107,11 +105,6 @@ def test_AlignmentRecords_read_all(alignment_env):
             record=retrieved_record,
             details=alignment_details
         )
-        # C9 - C10
-        check_relation_equivalence(
-            record=retrieved_record,
-            r_type="alignment"
-        )
 
 
 def test_AlignmentRecords_read(alignment_env):
@@ -129,10 +122,11 @@ def test_AlignmentRecords_read(alignment_env):
     # C9: Check hierarchy-enforcing field "relations" exist
     # C10: Check that all downstream relations have been captured 
     """
-    (
-        alignment_records, alignment_details, _,
-        (collab_id, project_id, _, _, participant_id), _
-    ) = alignment_env
+    alignment_records = alignment_env.records
+    alignment_details = alignment_env.details
+    collab_id = alignment_env.ids.collab_id
+    project_id = alignment_env.ids.project_id
+    participant_id = alignment_env.ids.participant_id
     retrieved_alignment = alignment_records.read(
         collab_id=collab_id,
         project_id=project_id,
@@ -140,27 +134,17 @@ def test_AlignmentRecords_read(alignment_env):
     )
     # C1
     assert retrieved_alignment is not None
-    # C2 - C5
-    check_key_equivalence(
+    # C2 - C5, C6 - C7, C9 - C10
+    check_record_equivalence(
         record=retrieved_alignment,
         ids=[participant_id, collab_id, project_id],
         r_type="alignment"
     )
-    # C6 - C7
-    check_link_equivalence(
-        record=retrieved_alignment,
-        r_type="alignment"
-    )
     # C8
     check_detail_equivalence(
         record=retrieved_alignment,
         details=alignment_details
     )
-    # C9 - C10
-    check_relation_equivalence(
-        record=retrieved_alignment,
-        r_type="alignment"
-    )
 
 
 def test_AlignmentRecords_update(alignment_env):
@@ -177,10 +161,11 @@ def test_AlignmentRecords_update(alignment_env):
     # C8: Check that alignment record values have been updated
     # C9: Check hierarchy-enforcing field "relations" did not change
     """
-    (
-        alignment_records, _, alignment_updates,
-        (collab_id, project_id, _, _, participant_id), _
-    ) = alignment_env
+    alignment_records = alignment_env.records
+    alignment_updates = alignment_env.updates
+    collab_id = alignment_env.ids.collab_id
+    project_id = alignment_env.ids.project_id
+    participant_id = alignment_env.ids.participant_id
     targeted_alignment = alignment_records.read(
         collab_id=collab_id,
         project_id=project_id,
@@ -229,10 +214,10 @@ def test_AlignmentRecords_delete(alignment_env):
     # C7: Check that the original alignment record was deleted (not a copy)
     # C8: Check that specified alignment record no longer exists
     """
-    (
-        alignment_records, _, _,
-        (collab_id, project_id, _, _, participant_id), reset_env
-    ) = alignment_env
+    alignment_records = alignment_env.records
+    collab_id = alignment_env.ids.collab_id
+    project_id = alignment_env.ids.project_id
+    participant_id = alignment_env.ids.participant_id
     targeted_alignment = alignment_records.read(
         collab_id=collab_id,
         project_id=project_id,
@@ -261,6 +246,4 @@ def test_AlignmentRecords_delete(alignment_env):
         collab_id=collab_id,
         project_id=project_id,
         participant_id=participant_id
-    ) is None
-
-    reset_env()
\ No newline at end of file
+    ) is None
\ No newline at end of file
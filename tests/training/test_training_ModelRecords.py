@@ -13,9 +13,9 @@
 # Custom
 from conftest import (
     check_key_equivalence,
-    check_relation_equivalence,
     check_link_equivalence,
-    check_detail_equivalence
+    check_detail_equivalence,
+    check_record_equivalence
 )
 
 
@@ -40,10 +40,12 @@ def test_ModelRecords_create(model_env):
     # C6: Check that keys in "link" are disjointed sets w.r.t "key"
     # C7: Check that specified record captured the correct specified details
     """
-    (
-        model_records, model_details, _,
-        (collab_id, project_id, expt_id, run_id, _)
-    ) = model_env
+    model_records = model_env.records
+    model_details = model_env.details
+    collab_id = model_env.ids.collab_id
+    project_id = model_env.ids.project_id
+    expt_id = model_env.ids.expt_id
+    run_id = model_env.ids.run_id
     created_model = model_records.create(
         collab_id=collab_id,
         project_id=project_id,
@@ -84,23 +86,21 @@ def test_ModelRecords_read_all(model_env):
     # C9: Check hierarchy-enforcing field "relations" exist
     # C10: Check that all downstream relations have been captured 
     """
-    (
-        model_records, model_details, _,
-        (collab_id, project_id, expt_id, run_id, _)
-    ) = model_env
+    model_records = model_env.records
+    model_details = model_env.details
+    collab_id = model_env.ids.collab_id
+    project_id = model_env.ids.project_id
+    expt_id = model_env.ids.expt_id
+    run_id = model_env.ids.run_id
     all_models = model_records.read_all()
     # C1
     assert len(all_models) == 1
+    retrieved_ids = frozenset([collab_id, project_id, expt_id, run_id])
     for retrieved_record in all_models:
-        # C2 - C5
-        check_key_equivalence(
-            record=retrieved_record,
-            ids=[collab_id, project_id, expt_id, run_id],
-            r_type="model"
-        )
-        # C6 - C7
-        check_link_equivalence(
+        # C2 - C5, C6 - C7, C9 - C10
+        check_record_equivalence(
             record=retrieved_record,
+            ids=retrieved_ids,
             r_type="model"
         )
         # C8
@@ -108,11 +108,6 @@ def test_ModelRecords_read_all(model_env):
             record=retrieved_record,
             details=model_details
         )
-        # C9 - C10
-        check_relation_equivalence(
-            record=retrieved_record,
-            r_type="model"
-        )
 
 
 def test_ModelRecords_read(model_env):
@@ -130,10 +125,12 @@ def test_ModelRecords_read(model_env):
     # C9: Check hierarchy-enforcing field "relations" exist
     # C10: Check that all downstream relations have been captured 
     """
-    (
-        model_records, model_details, _,
-        (collab_id, project_id, expt_id, run_id, _)
-    ) = model_env
+    model_records = model_env.records
+    model_details = model_env.details
+    collab_id = model_env.ids.collab_id
+    project_id = model_env.ids.project_id
+    expt_id = model_env.ids.expt_id
+    run_id = model_env.ids.run_id
     retrieved_model = model_records.read(
         collab_id=collab_id,
         project_id=project_id,
@@ -142,27 +139,17 @@ def test_ModelRecords_read(model_env):
     )
     # C1
     assert retrieved_model is not None
-    # C2 - C5
-    check_key_equivalence(
+    # C2 - C5, C6 - C7, C9 - C10
+    check_record_equivalence(
         record=retrieved_model,
         ids=[collab_id, project_id, expt_id, run_id],
         r_type="model"
     )
-    # C6 - C7
-    check_link_equivalence(
-        record=retrieved_model,
-        r_type="model"
-    )
     # C8
     check_detail_equivalence(
         record=retrieved_model,
         details=model_details
     )
-    # C9 - C10
-    check_relation_equivalence(
-        record=retrieved_model,
-        r_type="model"
-    )
 
 
 def test_ModelRecords_update(model_env):
@@ -179,10 +166,12 @@ def test_ModelRecords_update(model_env):
     # C8: Check that model record values have been updated
     # C9: Check hierarchy-enforcing field "relations" did not change
     """
-    (
-        model_records, _, model_updates,
-        (collab_id, project_id, expt_id, run_id, _)
-    ) = model_env
+    model_records = model_env.records
+    model_updates = model_env.updates
+    collab_id = model_env.ids.collab_id
+    project_id = model_env.ids.project_id
+    expt_id = model_env.ids.expt_id
+    run_id = model_env.ids.run_id
     targeted_model = model_records.read(
         collab_id=collab_id,
         project_id=project_id,
@@ -234,10 +223,11 @@ def test_ModelRecords_delete(model_env):
     # C7: Check that the original model record was deleted (not a copy)
     # C8: Check that specified model record no longer exists
     """
-    (
-        model_records, _, _,
-        (collab_id, project_id, expt_id, run_id, _)
-    ) = model_env
+    model_records = model_env.records
+    collab_id = model_env.ids.collab_id
+    project_id = model_env.ids.project_id
+    expt_id = model_env.ids.expt_id
+    run_id = model_env.ids.run_id
     targeted_model = model_records.read(
         collab_id=collab_id,
         project_id=project_id,